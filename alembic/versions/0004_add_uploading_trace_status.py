@@ -0,0 +1,49 @@
+"""allow 'uploading' graph trace status
+
+Revision ID: 0004_add_uploading_trace_status
+Revises: 0003_add_graph_run_traces_table
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_add_uploading_trace_status"
+down_revision = "0003_add_graph_run_traces_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE graph_run_traces "
+        "DROP CONSTRAINT IF EXISTS graph_run_traces_status_check"
+    )
+    op.execute(
+        """
+        ALTER TABLE graph_run_traces
+        ADD CONSTRAINT graph_run_traces_status_check
+            CHECK (status IN ('uploading', 'uploaded', 'failed', 'skipped'))
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE graph_run_traces SET status = 'failed', "
+        "error_message = COALESCE(error_message, 'export interrupted') "
+        "WHERE status = 'uploading'"
+    )
+    op.execute(
+        "ALTER TABLE graph_run_traces "
+        "DROP CONSTRAINT IF EXISTS graph_run_traces_status_check"
+    )
+    op.execute(
+        """
+        ALTER TABLE graph_run_traces
+        ADD CONSTRAINT graph_run_traces_status_check
+            CHECK (status IN ('uploaded', 'failed', 'skipped'))
+        """
+    )
@@ -0,0 +1,50 @@
+"""allow 'uploaded_truncated' graph trace status
+
+Revision ID: 0005_trace_status_truncated
+Revises: 0004_add_uploading_trace_status
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_trace_status_truncated"
+down_revision = "0004_add_uploading_trace_status"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE graph_run_traces "
+        "DROP CONSTRAINT IF EXISTS graph_run_traces_status_check"
+    )
+    op.execute(
+        """
+        ALTER TABLE graph_run_traces
+        ADD CONSTRAINT graph_run_traces_status_check
+            CHECK (status IN (
+                'uploading', 'uploaded', 'uploaded_truncated', 'failed', 'skipped'
+            ))
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "UPDATE graph_run_traces SET status = 'uploaded' "
+        "WHERE status = 'uploaded_truncated'"
+    )
+    op.execute(
+        "ALTER TABLE graph_run_traces "
+        "DROP CONSTRAINT IF EXISTS graph_run_traces_status_check"
+    )
+    op.execute(
+        """
+        ALTER TABLE graph_run_traces
+        ADD CONSTRAINT graph_run_traces_status_check
+            CHECK (status IN ('uploading', 'uploaded', 'failed', 'skipped'))
+        """
+    )
@@ -18,7 +18,7 @@ from app.agent.model import AnalysisOutput, ValidatorOutput
 from app.utils.hub_fallback import execute_with_fallback
 from app.service.hitl_service import save_pending_review
 from app.service.lexical_grounding_service import run_lexical_grounding
-from app.service.email_service import send_hitl_notification
+from app.service.email_service import send_hitl_notification_async
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -525,7 +525,7 @@ def theological_validator_node(state: TheologicalState):
 def hitl_pending_node(state: TheologicalState):
     """
     Halts execution and persists state for human review.
-    Sends email notification to the reviewer.
+    Queues an email notification to the reviewer (sent in the background).
     """
     run_id = state.get("run_id", "unknown")
     verses_int = [int(v) for v in state.get("verses", [])]
@@ -553,11 +553,11 @@ def hitl_pending_node(state: TheologicalState):
     except Exception as e:
         logger.error(f"Failed to persist HITL state: {e}", extra={"run_id": run_id})
 
-    # Send email notification
+    # Send email notification (background SMTP pool, does not block the graph)
     last_step = (state.get("reasoning_steps") or [{}])[-1]
     alerts = last_step.get("alerts", [])
 
-    send_hitl_notification(
+    send_hitl_notification_async(
         run_id=run_id,
         book=state["bible_book"],
         chapter=state["chapter"],
@@ -8,7 +8,7 @@ business logic to the analysis service.
 import asyncio
 import json
 import logging
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 
@@ -19,7 +19,7 @@ from app.service.analysis_service import (
     run_analysis,
     stream_analysis,
 )
-from app.service.trace_service import export_graph_trace
+from app.service.trace_service import schedule_graph_trace_export
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Analysis"])
@@ -31,7 +31,7 @@ router = APIRouter(tags=["Analysis"])
     summary="Analyze biblical text",
     description="Sends selected verses to the theological agent for multi-module analysis.",
 )
-async def analyze_text(request: AnalyzeRequest, background_tasks: BackgroundTasks):
+async def analyze_text(request: AnalyzeRequest):
     """
     Analyze biblical text using the theological multi-agent system.
 
@@ -84,11 +84,7 @@ async def analyze_text(request: AnalyzeRequest, background_tasks: BackgroundTask
     # --- Response Handling ---
     if not result.success:
         if result.run_id and result.langsmith_run_id:
-            await run_in_threadpool(
-                export_graph_trace,
-                result.run_id,
-                result.langsmith_run_id,
-            )
+            schedule_graph_trace_export(result.run_id, result.langsmith_run_id)
         logger.error(f"Analysis returned failure: {result.error}")
         raise HTTPException(
             status_code=500,
@@ -96,11 +92,7 @@ async def analyze_text(request: AnalyzeRequest, background_tasks: BackgroundTask
         )
 
     if not result.from_cache and result.run_id and result.langsmith_run_id:
-        background_tasks.add_task(
-            export_graph_trace,
-            result.run_id,
-            result.langsmith_run_id,
-        )
+        schedule_graph_trace_export(result.run_id, result.langsmith_run_id)
 
     # HITL pending — return 202 Accepted with governance info
     if result.hitl_status == "pending":
@@ -204,5 +196,7 @@ async def stream_analyze_text(request: AnalyzeRequest):
             # Prevent nginx / Cloudflare from buffering chunks
             "X-Accel-Buffering": "no",
             "Cache-Control": "no-cache",
+            # Opt out of GZipMiddleware, which would hold events in its buffer
+            "Content-Encoding": "identity",
         },
     )
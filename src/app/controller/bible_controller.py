@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException
+import hashlib
+from fastapi import APIRouter, HTTPException, Request, Response
 from typing import List
 
 from app.schemas import VerseResponse
@@ -6,6 +7,9 @@ from app.service.bible_service import get_verses, get_book_by_abbrev
 
 router = APIRouter(prefix="/bible", tags=["Bible"])
 
+# Bible text is static, so chapter responses can be cached by clients/proxies
+VERSES_CACHE_CONTROL = "public, max-age=86400"
+
 
 @router.get(
     "/{abbrev}/{chapter}/verses",
@@ -13,7 +17,9 @@ router = APIRouter(prefix="/bible", tags=["Bible"])
     summary="Get verses for a chapter",
     description="Retrieves all verses for a specific book abbreviation and chapter number.",
 )
-async def get_chapter_verses(abbrev: str, chapter: int):
+async def get_chapter_verses(
+    abbrev: str, chapter: int, request: Request, response: Response
+):
     """
     Retrieve all verses for a specific book and chapter.
 
@@ -35,6 +41,13 @@ async def get_chapter_verses(abbrev: str, chapter: int):
             detail=f"Chapter {chapter} not found. Book '{abbrev}' has {total_chapters} chapters.",
         )
 
+    etag = '"{}"'.format(
+        hashlib.md5(f"{book['abbrev']}:{chapter}".encode()).hexdigest()
+    )
+    cache_headers = {"ETag": etag, "Cache-Control": VERSES_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
     verses = get_verses(abbrev, chapter)
 
     if not verses:
@@ -42,4 +55,5 @@ async def get_chapter_verses(abbrev: str, chapter: int):
             status_code=404, detail=f"No verses found for {abbrev} chapter {chapter}"
         )
 
+    response.headers.update(cache_headers)
     return verses
@@ -4,9 +4,11 @@ HITL Controller
 Endpoints for Human-in-the-Loop review management.
 """
 
+import hashlib
+import json
 import logging
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.concurrency import run_in_threadpool
 
 from app.schemas import HITLReviewResponse, HITLApproveRequest, AnalyzeResponse
@@ -26,10 +28,20 @@ router = APIRouter(prefix="/hitl", tags=["HITL"])
     summary="List pending HITL reviews",
     description="Returns all analyses awaiting human review.",
 )
-async def list_pending_reviews():
+async def list_pending_reviews(request: Request, response: Response):
     """List all analyses pending human theological review."""
     reviews = await run_in_threadpool(get_pending_reviews)
-    return {"pending": reviews, "count": len(reviews)}
+    body = {"pending": reviews, "count": len(reviews)}
+
+    # Pollers send If-None-Match; an unchanged queue costs only a 304
+    encoded = json.dumps(body, sort_keys=True, default=str).encode()
+    etag = f'"{hashlib.md5(encoded).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    response.headers.update(cache_headers)
+    return body
 
 
 @router.get(
@@ -6,6 +6,7 @@ Provides a connection pool for cache, audit, and HITL persistence.
 """
 
 import os
+import threading
 
 from psycopg_pool import ConnectionPool
 from app.utils.logger import get_logger
@@ -13,6 +14,9 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 _pool: ConnectionPool | None = None
+_trace_pool: ConnectionPool | None = None
+# Several trace-export threads may ask for the pool at once; build it only once
+_trace_pool_lock = threading.Lock()
 
 
 def get_pool() -> ConnectionPool:
@@ -52,6 +56,45 @@ def get_connection():
     return get_pool().connection()
 
 
+def get_trace_pool() -> ConnectionPool:
+    """
+    Get or create the small pool used by background trace-status writes.
+
+    Kept separate from the main pool so the trace exporter can never take
+    connections away from request-path cache/audit/HITL queries.
+    """
+    global _trace_pool
+    if _trace_pool is None:
+        with _trace_pool_lock:
+            if _trace_pool is None:
+                db_url = os.getenv("DB_URL")
+                if not db_url:
+                    raise ValueError(
+                        "DB_URL not found in environment. Check your .env file."
+                    )
+
+                # Default matches TRACE_EXPORT_WORKERS so each export thread
+                # can hold a connection without waiting on another
+                _trace_pool = ConnectionPool(
+                    conninfo=db_url,
+                    min_size=1,
+                    max_size=int(os.getenv("TRACE_DB_POOL_MAX", "4")),
+                    open=True,
+                    kwargs={"prepare_threshold": None},
+                )
+                logger.info(
+                    "Trace database connection pool created",
+                    extra={"event": "db_trace_pool_created"},
+                )
+
+    return _trace_pool
+
+
+def get_trace_connection():
+    """Get a connection from the trace pool (context manager)."""
+    return get_trace_pool().connection()
+
+
 def check_db_health() -> bool:
     """Check if the database is reachable."""
     try:
@@ -67,11 +110,19 @@ def check_db_health() -> bool:
 
 
 def close_pool() -> None:
-    """Close the connection pool (call on shutdown)."""
-    global _pool
+    """Close the connection pools (call on shutdown)."""
+    global _pool, _trace_pool
     if _pool is not None:
         _pool.close()
         _pool = None
         logger.info(
             "Database connection pool closed", extra={"event": "db_pool_closed"}
         )
+    with _trace_pool_lock:
+        trace_pool, _trace_pool = _trace_pool, None
+    if trace_pool is not None:
+        trace_pool.close()
+        logger.info(
+            "Trace database connection pool closed",
+            extra={"event": "db_trace_pool_closed"},
+        )
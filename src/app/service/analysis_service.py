@@ -10,7 +10,6 @@ Handles the business logic for theological text analysis:
 
 import time
 import uuid
-import threading
 from datetime import datetime, timezone
 from typing import List, Optional, Generator
 from dataclasses import dataclass
@@ -19,7 +18,7 @@ from app.agent.build import build_graph
 from app.agent.agentState import TheologicalState
 from app.utils.logger import get_logger
 from app.service.cache_service import (
-    generate_cache_key,
+    AnalysisIdentity,
     get_cached_analysis,
     save_to_cache,
 )
@@ -119,7 +118,7 @@ def run_analysis(input_data: AnalysisInput) -> AnalysisResult:
     start_time = time.time()
 
     # --- Cache Check ---
-    cache_key = generate_cache_key(
+    identity = AnalysisIdentity.create(
         input_data.book,
         input_data.chapter,
         input_data.verses,
@@ -127,7 +126,7 @@ def run_analysis(input_data: AnalysisInput) -> AnalysisResult:
     )
 
     try:
-        cached = get_cached_analysis(cache_key)
+        cached = get_cached_analysis(identity)
         if cached:
             duration_ms = int((time.time() - start_time) * 1000)
             logger.info(
@@ -266,11 +265,7 @@ def run_analysis(input_data: AnalysisInput) -> AnalysisResult:
         # --- Save to cache ---
         try:
             save_to_cache(
-                cache_key=cache_key,
-                book=input_data.book,
-                chapter=input_data.chapter,
-                verses=input_data.verses,
-                modules=input_data.selected_modules,
+                identity,
                 final_analysis=final_analysis,
                 run_id=run_id,
             )
@@ -368,14 +363,14 @@ def stream_analysis(input_data: AnalysisInput) -> Generator[dict, None, None]:
     start_time = time.time()
 
     # ─── Cache Check ──────────────────────────────────────────────────────────
-    cache_key = generate_cache_key(
+    identity = AnalysisIdentity.create(
         input_data.book,
         input_data.chapter,
         input_data.verses,
         input_data.selected_modules,
     )
     try:
-        cached = get_cached_analysis(cache_key)
+        cached = get_cached_analysis(identity)
         if cached:
             duration_ms = int((time.time() - start_time) * 1000)
             save_run(
@@ -510,11 +505,7 @@ def stream_analysis(input_data: AnalysisInput) -> Generator[dict, None, None]:
     if final_analysis and not hitl_status:
         try:
             save_to_cache(
-                cache_key=cache_key,
-                book=input_data.book,
-                chapter=input_data.chapter,
-                verses=input_data.verses,
-                modules=input_data.selected_modules,
+                identity,
                 final_analysis=final_analysis,
                 run_id=run_id,
             )
@@ -539,16 +530,12 @@ def stream_analysis(input_data: AnalysisInput) -> Generator[dict, None, None]:
         duration_ms=duration_ms,
     )
 
-    # ─── Trace export (fire-and-forget daemon thread) ─────────────────────────
+    # ─── Trace export (fire-and-forget on the export pool) ────────────────────
     try:
-        from app.service.trace_service import export_graph_trace
-        threading.Thread(
-            target=export_graph_trace,
-            args=(run_id, langsmith_run_id),
-            daemon=True,
-        ).start()
+        from app.service.trace_service import schedule_graph_trace_export
+        schedule_graph_trace_export(run_id, langsmith_run_id)
     except Exception as e:
-        logger.warning(f"Stream: trace export thread failed to start: {e}")
+        logger.warning(f"Stream: trace export could not be scheduled: {e}")
 
     # ─── Final event ──────────────────────────────────────────────────────────
     yield {
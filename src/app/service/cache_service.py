@@ -6,7 +6,12 @@ Cache key = SHA-256 hash of (book + chapter + sorted_verses + sorted_modules).
 """
 
 import hashlib
-import json
+import sys
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from app.database.connection import get_connection
@@ -14,6 +19,79 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# In-process record of keys known to exist in analysis_cache (populated on
+# cache hits and successful writes) so save_to_cache can skip a redundant
+# INSERT ... ON CONFLICT round-trip. Bounded with FIFO eviction.
+KNOWN_KEYS_MAX = 4096
+_known_keys: set[str] = set()
+_known_keys_order: deque[str] = deque()
+_known_keys_lock = threading.Lock()
+
+
+def _is_known_key(cache_key: str) -> bool:
+    with _known_keys_lock:
+        return cache_key in _known_keys
+
+
+def _remember_key(cache_key: str) -> None:
+    with _known_keys_lock:
+        if cache_key in _known_keys:
+            return
+        _known_keys.add(cache_key)
+        _known_keys_order.append(cache_key)
+        while len(_known_keys_order) > KNOWN_KEYS_MAX:
+            _known_keys.discard(_known_keys_order.popleft())
+
+
+@dataclass(frozen=True)
+class AnalysisIdentity:
+    """
+    Normalized analysis parameters shared by the cache key and the cache row.
+
+    Build with `AnalysisIdentity.create(...)`; the cache key is computed once
+    and memoized on the instance.
+    """
+
+    book: str
+    chapter: int
+    verses: tuple[int, ...]
+    modules: tuple[str, ...]
+
+    @classmethod
+    def create(
+        cls, book: str, chapter: int, verses: list[int], modules: list[str]
+    ) -> "AnalysisIdentity":
+        """Sort verses and modules so the identity is order-independent."""
+        return cls(
+            book=book,
+            chapter=chapter,
+            verses=tuple(sorted(set(verses))),
+            modules=tuple(sorted(modules)),
+        )
+
+    @cached_property
+    def cache_key(self) -> str:
+        """
+        SHA-256 over the canonical binary form of the identity.
+
+        Verses are packed as a little-endian int32 array instead of JSON text,
+        which avoids per-int string encoding on whole-chapter requests. Each
+        part is fed straight into the hasher, with no concatenated payload copy.
+        """
+        verses_arr = array("i", self.verses)
+        if sys.byteorder != "little":
+            verses_arr.byteswap()
+
+        hasher = hashlib.sha256()
+        hasher.update(self.book.strip().lower().encode())
+        hasher.update(b"\x00")
+        hasher.update(self.chapter.to_bytes(4, "little"))
+        hasher.update(len(verses_arr).to_bytes(4, "little"))
+        hasher.update(memoryview(verses_arr))
+        hasher.update("\x00".join(self.modules).encode())
+
+        return hasher.hexdigest()
+
 
 def generate_cache_key(
     book: str, chapter: int, verses: list[int], modules: list[str]
@@ -23,26 +101,17 @@ def generate_cache_key(
 
     Sorts verses and modules to ensure order-independence.
     """
-    payload = json.dumps(
-        {
-            "book": book.strip().lower(),
-            "chapter": chapter,
-            "verses": sorted(verses),
-            "modules": sorted(modules),
-        },
-        sort_keys=True,
-    )
+    return AnalysisIdentity.create(book, chapter, verses, modules).cache_key
 
-    return hashlib.sha256(payload.encode()).hexdigest()
 
-
-def get_cached_analysis(cache_key: str) -> Optional[str]:
+def get_cached_analysis(identity: AnalysisIdentity) -> Optional[str]:
     """
-    Look up a cached analysis by cache key.
+    Look up a cached analysis by its identity.
 
     Returns the final_analysis text if found, None otherwise.
     Increments hit_count on cache hit.
     """
+    cache_key = identity.cache_key
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
@@ -59,6 +128,7 @@ def get_cached_analysis(cache_key: str) -> Optional[str]:
             conn.commit()
 
         if row:
+            _remember_key(cache_key)
             logger.info(
                 "Cache HIT",
                 extra={"event": "cache_hit", "cache_key": cache_key[:12]},
@@ -80,18 +150,19 @@ def get_cached_analysis(cache_key: str) -> Optional[str]:
 
 
 def save_to_cache(
-    cache_key: str,
-    book: str,
-    chapter: int,
-    verses: list[int],
-    modules: list[str],
+    identity: AnalysisIdentity,
     final_analysis: str,
     run_id: str | None = None,
 ) -> None:
     """
     Save a completed analysis to cache.
     Uses ON CONFLICT DO NOTHING to handle race conditions.
+    Skips the INSERT entirely when the key is already known in-process.
     """
+    cache_key = identity.cache_key
+    if _is_known_key(cache_key):
+        return
+
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
@@ -102,10 +173,19 @@ def save_to_cache(
                     VALUES (%s, %s, %s, %s, %s, %s, %s)
                     ON CONFLICT (cache_key) DO NOTHING
                     """,
-                    (cache_key, book, chapter, verses, modules, final_analysis, run_id),
+                    (
+                        cache_key,
+                        identity.book,
+                        identity.chapter,
+                        list(identity.verses),
+                        list(identity.modules),
+                        final_analysis,
+                        run_id,
+                    ),
                 )
             conn.commit()
 
+        _remember_key(cache_key)
         logger.info(
             "Analysis cached",
             extra={"event": "cache_write", "cache_key": cache_key[:12]},
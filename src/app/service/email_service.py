@@ -5,8 +5,10 @@ Sends HITL notification emails via SMTP (smtplib — stdlib, no dependencies).
 Uses Gmail App Passwords configured in .env.
 """
 
+import atexit
 import os
 import smtplib
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional
@@ -15,6 +17,10 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SMTP sessions are I/O-bound: a small thread pool keeps them off the graph thread.
+_email_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="smtp")
+atexit.register(_email_pool.shutdown)
+
 
 def send_hitl_notification(
     run_id: str,
@@ -113,3 +119,29 @@ def send_hitl_notification(
             extra={"event": "email_error", "run_id": run_id},
         )
         return False
+
+
+def send_hitl_notification_async(
+    run_id: str,
+    book: str,
+    chapter: int,
+    verses: list[int],
+    risk_level: str,
+    alerts: list[str],
+    review_url: Optional[str] = None,
+) -> Future:
+    """
+    Queue a HITL notification on the background SMTP pool.
+
+    Returns immediately with a Future resolving to send_hitl_notification's result.
+    """
+    return _email_pool.submit(
+        send_hitl_notification,
+        run_id=run_id,
+        book=book,
+        chapter=chapter,
+        verses=verses,
+        risk_level=risk_level,
+        alerts=alerts,
+        review_url=review_url,
+    )
@@ -11,6 +11,8 @@ import json
 from typing import Optional
 from dataclasses import dataclass
 
+from psycopg.rows import dict_row
+
 from app.database.connection import get_connection
 from app.utils.logger import get_logger
 
@@ -117,7 +119,7 @@ def get_pending_reviews() -> list[dict]:
     """Get all pending HITL reviews."""
     try:
         with get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=dict_row) as cur:
                 cur.execute(
                     """
                     SELECT run_id, book, chapter, verses, risk_level, alerts,
@@ -129,19 +131,10 @@ def get_pending_reviews() -> list[dict]:
                 )
                 rows = cur.fetchall()
 
-        return [
-            {
-                "run_id": row[0],
-                "book": row[1],
-                "chapter": row[2],
-                "verses": row[3],
-                "risk_level": row[4],
-                "alerts": row[5],
-                "status": row[6],
-                "created_at": row[7].isoformat() if row[7] else None,
-            }
-            for row in rows
-        ]
+        for row in rows:
+            created_at = row["created_at"]
+            row["created_at"] = created_at.isoformat() if created_at else None
+        return rows
 
     except Exception as e:
         logger.error(f"Failed to fetch pending reviews: {e}")
@@ -152,14 +145,19 @@ def get_review(run_id: str) -> Optional[dict]:
     """Get full details of a HITL review."""
     try:
         with get_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=dict_row) as cur:
                 cur.execute(
                     """
                     SELECT run_id, book, chapter, verses, risk_level, alerts,
                            validation_content, panorama_content, lexical_content,
                            historical_content, intertextual_content, selected_modules,
                            edited_content, status, created_at, reviewed_at,
-                           model_versions, prompt_versions, tokens_consumed, reasoning_steps
+                           jsonb_strip_nulls(jsonb_build_object(
+                               'model_versions', model_versions,
+                               'prompt_versions', prompt_versions,
+                               'tokens_consumed', tokens_consumed,
+                               'reasoning_steps', reasoning_steps
+                           )) AS meta
                     FROM hitl_reviews
                     WHERE run_id = %s
                     """,
@@ -170,28 +168,18 @@ def get_review(run_id: str) -> Optional[dict]:
         if not row:
             return None
 
-        return {
-            "run_id": row[0],
-            "book": row[1],
-            "chapter": row[2],
-            "verses": row[3],
-            "risk_level": row[4],
-            "alerts": row[5],
-            "validation_content": row[6],
-            "panorama_content": row[7],
-            "lexical_content": row[8],
-            "historical_content": row[9],
-            "intertextual_content": row[10],
-            "selected_modules": row[11],
-            "edited_content": row[12],
-            "status": row[13],
-            "created_at": row[14].isoformat() if row[14] else None,
-            "reviewed_at": row[15].isoformat() if row[15] else None,
-            "model_versions": json.loads(row[16]) if row[16] else None,
-            "prompt_versions": json.loads(row[17]) if row[17] else None,
-            "tokens_consumed": json.loads(row[18]) if row[18] else None,
-            "reasoning_steps": json.loads(row[19]) if row[19] else None,
-        }
+        # psycopg decodes the JSONB meta column into a dict
+        meta = row.pop("meta") or {}
+        for key in ("created_at", "reviewed_at"):
+            row[key] = row[key].isoformat() if row[key] else None
+        for key in (
+            "model_versions",
+            "prompt_versions",
+            "tokens_consumed",
+            "reasoning_steps",
+        ):
+            row[key] = meta.get(key)
+        return row
 
     except Exception as e:
         logger.error(f"Failed to fetch review {run_id}: {e}")
@@ -9,18 +9,39 @@ Single-pass mode:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import functools
 import json
 import os
 import re
+import secrets
 import threading
 import time
-import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
-from urllib.parse import urlparse
+from typing import Any, Coroutine
 
 from app.service.bible_service import get_specific_verses
 from app.utils.logger import get_logger
+from app.utils.prompt_template import compile_template, render_segments
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Imported at module load so the first grounded request does not pay for it
+try:
+    from google.adk.agents import Agent
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+    from google.adk.tools import google_search
+    from google.genai import types
+
+    _ADK_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    _ADK_AVAILABLE = False
 
 try:
     from langsmith import Client, traceable
@@ -42,7 +63,26 @@ FALLBACK_FILE = os.path.normpath(
     )
 )
 _ls_client: Client | None = None
-_lexical_prompt_cache: dict[str, str | None] | None = None
+_lexical_prompt_cache: dict[str, Any] | None = None
+_fallback_data: dict | None = None
+_fallback_lock = threading.Lock()
+_adk_loop: asyncio.AbstractEventLoop | None = None
+_adk_loop_lock = threading.Lock()
+# Extra wait at the sync boundary beyond the in-loop ADK timeout
+SYNC_BOUNDARY_GRACE_SECONDS = 5.0
+ADK_APP_NAME = "theological_agent_lexical_grounding"
+GROUNDING_PROVIDER = "adk_google_search"
+ADK_USER_ID = "lexical_grounding_user"
+# (model, AFC limit) -> (Runner, session service)
+RUNNER_CACHE_MAX = 8
+# The agent's own instruction stays fixed so runners can be shared across
+# passages; the rendered (passage-specific) system prompt goes in the user turn
+ADK_AGENT_INSTRUCTION = (
+    "Follow the instructions in the user message. Use Google Search to ground "
+    "every lexical claim and cite the sources you relied on."
+)
+_runner_cache: OrderedDict[tuple, tuple[Any, Any]] = OrderedDict()
+_runner_cache_lock = threading.Lock()
 
 
 @dataclass
@@ -61,6 +101,22 @@ class LexicalGroundingResult:
     model_name: str | None = None
 
 
+@dataclass(frozen=True)
+class LexicalGroundingConfig:
+    """Grounding settings parsed from env once per process."""
+
+    timeout_ms: int
+    max_sources: int
+    afc_max_remote_calls: int
+    min_report_chars: int
+    exclude_domains: tuple[str, ...]
+    google_api_key_present: bool
+
+    @property
+    def timeout_seconds(self) -> float:
+        return self.timeout_ms / 1000.0
+
+
 def _get_ls_client() -> Client:
     global _ls_client
     if Client is None:
@@ -140,9 +196,20 @@ def _load_prompt_from_hub() -> dict[str, str | None]:
     }
 
 
+def _get_fallback_data() -> dict:
+    """Parse the local fallback JSON once per process and reuse it."""
+    global _fallback_data
+    if _fallback_data is None:
+        with _fallback_lock:
+            if _fallback_data is None:
+                with open(FALLBACK_FILE, "rb") as file:
+                    raw = file.read()
+                _fallback_data = orjson.loads(raw) if orjson else json.loads(raw)
+    return _fallback_data
+
+
 def _load_prompt_from_local_fallback() -> dict[str, str | None]:
-    with open(FALLBACK_FILE, "r", encoding="utf-8") as file:
-        fallback_data = json.load(file).get(PROMPT_NAME) or {}
+    fallback_data = _get_fallback_data().get(PROMPT_NAME) or {}
     raw_messages = fallback_data.get("messages") or []
     system_template, human_template = _extract_templates(raw_messages)
     if not system_template and not human_template:
@@ -160,7 +227,7 @@ def _load_prompt_from_local_fallback() -> dict[str, str | None]:
     }
 
 
-def _get_lexical_prompt_config() -> dict[str, str | None]:
+def _get_lexical_prompt_config() -> dict[str, Any]:
     global _lexical_prompt_cache
     if _lexical_prompt_cache is not None:
         return _lexical_prompt_cache
@@ -176,8 +243,8 @@ def _get_lexical_prompt_config() -> dict[str, str | None]:
                 "prompt_commit_hash": prompt_config.get("prompt_commit_hash"),
             },
         )
-        _lexical_prompt_cache = prompt_config
-        return prompt_config
+        _lexical_prompt_cache = _with_compiled_templates(prompt_config)
+        return _lexical_prompt_cache
     except Exception as hub_error:
         logger.warning(
             "Failed to load lexical prompt from LangSmith Hub; trying local fallback.",
@@ -199,8 +266,8 @@ def _get_lexical_prompt_config() -> dict[str, str | None]:
                 "prompt_commit_hash": prompt_config.get("prompt_commit_hash"),
             },
         )
-        _lexical_prompt_cache = prompt_config
-        return prompt_config
+        _lexical_prompt_cache = _with_compiled_templates(prompt_config)
+        return _lexical_prompt_cache
     except Exception as fallback_error:
         logger.warning(
             "Failed to load lexical prompt from local fallback; using built-in template.",
@@ -216,6 +283,7 @@ def _get_lexical_prompt_config() -> dict[str, str | None]:
         ) from fallback_error
 
 
+@functools.lru_cache(maxsize=None)
 def _parse_int_env(name: str, default: int) -> int:
     raw = os.getenv(name, str(default))
     try:
@@ -224,11 +292,32 @@ def _parse_int_env(name: str, default: int) -> int:
         return default
 
 
-def _parse_csv_env(name: str) -> list[str]:
+@functools.lru_cache(maxsize=None)
+def _parse_csv_env(name: str) -> tuple[str, ...]:
     raw = os.getenv(name, "")
     if not raw:
-        return []
-    return [item.strip().lower() for item in raw.split(",") if item.strip()]
+        return ()
+    return tuple(item.strip().lower() for item in raw.split(",") if item.strip())
+
+
+@functools.cache
+def _get_grounding_config() -> LexicalGroundingConfig:
+    return LexicalGroundingConfig(
+        timeout_ms=_parse_int_env("LEXICAL_GROUNDING_TIMEOUT_MS", 35000),
+        max_sources=_parse_int_env("LEXICAL_GROUNDING_MAX_SOURCES", 5),
+        afc_max_remote_calls=_parse_int_env("LEXICAL_ADK_AFC_MAX_REMOTE_CALLS", 3),
+        min_report_chars=_parse_int_env("LEXICAL_ADK_MIN_REPORT_CHARS", 300),
+        exclude_domains=_parse_csv_env("LEXICAL_GROUNDING_EXCLUDE_DOMAINS"),
+        google_api_key_present=bool(os.getenv("GOOGLE_API_KEY")),
+    )
+
+
+def reload_config() -> LexicalGroundingConfig:
+    """Re-read grounding settings from the environment (e.g. after a reload)."""
+    _parse_int_env.cache_clear()
+    _parse_csv_env.cache_clear()
+    _get_grounding_config.cache_clear()
+    return _get_grounding_config()
 
 
 def _safe_excerpt(text: str, max_len: int = 450) -> str:
@@ -256,90 +345,161 @@ def _extract_text_from_event(event: Any) -> str:
     return "\n".join([t for t in texts if t]).strip()
 
 
-def _to_primitive(value: Any) -> Any:
-    if value is None or isinstance(value, (str, int, float, bool)):
-        return value
-    if isinstance(value, list):
-        return [_to_primitive(v) for v in value]
-    if isinstance(value, dict):
-        return {k: _to_primitive(v) for k, v in value.items()}
+_SCALAR_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def _dump_object(value: Any) -> Any:
+    """
+    Convert an SDK object (Pydantic model, dataclass-like) into a dict only when
+    the payload walk reaches it. Returns None when it cannot be converted.
+    """
     if hasattr(value, "model_dump"):
         try:
-            return _to_primitive(value.model_dump())
+            return value.model_dump(mode="python")
         except Exception:
             pass
     if hasattr(value, "dict"):
         try:
-            return _to_primitive(value.dict())
+            return value.dict()
         except Exception:
             pass
     if hasattr(value, "__dict__"):
         try:
-            return _to_primitive(vars(value))
+            return vars(value)
         except Exception:
             pass
-    return str(value)
+    return None
 
 
-def _extract_sources_from_payload(payload: Any) -> list[dict]:
-    candidates: list[dict] = []
+_SEARCH_TOOL_PREFIX = "google_search"
+_SEARCH_CALL_KEY_SUFFIX = "google_search_call"
 
-    def visit(node: Any) -> None:
-        if isinstance(node, dict):
-            url = node.get("url") or node.get("uri")
-            title = node.get("title") or node.get("source") or ""
-            snippet = node.get("snippet") or node.get("text") or ""
 
-            if isinstance(url, str) and url.startswith(("http://", "https://")):
-                domain = urlparse(url).netloc.lower()
-                candidates.append(
-                    {
-                        "url": url,
-                        "title": str(title).strip(),
-                        "snippet": _safe_excerpt(str(snippet), max_len=220),
-                        "domain": domain,
-                    }
-                )
+@dataclass
+class _ExtractionState:
+    """Accumulators filled event by event while the ADK stream is consumed."""
 
-            for child in node.values():
-                visit(child)
-            return
+    sources: list[dict] = field(default_factory=list)
+    seen_urls: set[str] = field(default_factory=set)
+    usage: dict = field(default_factory=lambda: {"input": 0, "output": 0})
+    search_call_hits: int = 0
+    tool_name_hits: int = 0
 
-        if isinstance(node, list):
-            for item in node:
-                visit(item)
+    @property
+    def search_calls(self) -> int:
+        total = max(self.search_call_hits, self.tool_name_hits)
+        if total == 0 and self.sources:
+            total = 1
+        return total
 
-    visit(payload)
 
-    seen: set[tuple[str, str]] = set()
-    deduped: list[dict] = []
-    for src in candidates:
-        key = (src.get("url", ""), src.get("title", ""))
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(src)
-    return deduped
+def _extract_all_from_event(event: Any, state: _ExtractionState) -> None:
+    """
+    Single walk over one ADK event collecting sources and a best-effort search
+    call count into ``state``. Token usage is read straight off the event.
+    """
+    usage_metadata = getattr(event, "usage_metadata", None)
+    if usage_metadata is not None:
+        state.usage["input"] += getattr(usage_metadata, "prompt_token_count", 0) or 0
+        state.usage["output"] += (
+            getattr(usage_metadata, "candidates_token_count", 0) or 0
+        )
+
+    sources = state.sources
+    seen_urls = state.seen_urls
+    dumped_objects: set[int] = set()
+
+    # Iterative pre-order walk (children pushed reversed to keep document order).
+    # SDK objects are dumped lazily as they are reached instead of cloning the
+    # whole payload up front.
+    stack: list[Any] = [event]
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, (dict, list, tuple)):
+            node_id = id(node)
+            if node_id in dumped_objects:
+                continue
+            dumped_objects.add(node_id)
+            node = _dump_object(node)
+        if isinstance(node, dict):
+            name = node.get("name")
+            if isinstance(name, str) and name.startswith(_SEARCH_TOOL_PREFIX):
+                state.tool_name_hits += 1
 
+            url = node.get("url") or node.get("uri")
+            if isinstance(url, str) and url.startswith(("http://", "https://")):
+                # Dedup on scheme/host case-folded and no trailing slash; the
+                # source dict is only built for the first occurrence
+                scheme, _, host, *path = url.split("/", 3)
+                domain = host.lower()
+                dedup_key = f"{scheme.lower()}//{domain}/{path[0] if path else ''}"
+                dedup_key = dedup_key.rstrip("/")
+                if dedup_key not in seen_urls:
+                    seen_urls.add(dedup_key)
+                    title = node.get("title") or node.get("source") or ""
+                    snippet = node.get("snippet") or node.get("text") or ""
+                    sources.append(
+                        {
+                            "url": url,
+                            "title": str(title).strip(),
+                            "snippet": _safe_excerpt(str(snippet), max_len=220),
+                            "domain": domain,
+                        }
+                    )
+
+            for key, child in reversed(node.items()):
+                if isinstance(key, str) and key.endswith(_SEARCH_CALL_KEY_SUFFIX):
+                    state.search_call_hits += 1
+                # Usage metadata is already counted and never carries sources
+                if key != "usage_metadata" and not isinstance(child, _SCALAR_TYPES):
+                    stack.append(child)
+        elif isinstance(node, (list, tuple)):
+            stack.extend(
+                item for item in reversed(node) if not isinstance(item, _SCALAR_TYPES)
+            )
 
-def _filter_sources(sources: list[dict], exclude_domains: list[str]) -> list[dict]:
+
+def _filter_sources(
+    sources: list[dict], exclude_domains: tuple[str, ...]
+) -> list[dict]:
     if not exclude_domains:
         return sources
 
+    blocked = [_normalize_domain(d) for d in exclude_domains]
+    blocked_domains = tuple(d for d in blocked if "." in d)
+    # Dot-less entries (e.g. "wikipedia") match any label of the host
+    blocked_labels = frozenset(d for d in blocked if d and "." not in d)
+
     filtered: list[dict] = []
     for src in sources:
-        domain = (src.get("domain") or "").lower()
-        if any(blocked in domain for blocked in exclude_domains):
+        domain = _normalize_domain(src.get("domain") or "")
+        if any(domain == d or domain.endswith("." + d) for d in blocked_domains):
+            continue
+        if blocked_labels and not blocked_labels.isdisjoint(domain.split(".")):
             continue
         filtered.append(src)
     return filtered
 
 
-def _render_template(template: str, variables: dict[str, Any]) -> str:
-    rendered = template or ""
-    for key, value in variables.items():
-        rendered = rendered.replace("{" + key + "}", str(value))
-    return rendered
+def _normalize_domain(value: str) -> str:
+    """Lowercase a host and drop userinfo, port and a trailing dot."""
+    host = value.strip().lower().rpartition("@")[2]
+    if host.startswith("["):
+        host = host.partition("]")[0] + "]"
+    else:
+        host = host.partition(":")[0]
+    return host.rstrip(".")
+
+
+def _with_compiled_templates(prompt_config: dict[str, Any]) -> dict[str, Any]:
+    """Attach pre-split templates so rendering never re-parses them."""
+    prompt_config["_system_segments"] = compile_template(
+        str(prompt_config.get("system_template") or "")
+    )
+    prompt_config["_human_segments"] = compile_template(
+        str(prompt_config.get("human_template") or "")
+    )
+    return prompt_config
 
 
 def _build_adk_prompt(
@@ -348,28 +508,24 @@ def _build_adk_prompt(
     verse_numbers: list[int],
     verse_texts: list[str],
     max_sources: int,
-    exclude_domains: list[str],
-) -> tuple[str, str, str, str | None]:
-    reference = f"{book} {chapter}:{','.join(str(v) for v in verse_numbers)}"
-    verse_lines = [
+    exclude_domains: tuple[str, ...],
+) -> tuple[str, str, str, str | None, str | None]:
+    reference = f"{book} {chapter}:{','.join(map(str, verse_numbers))}"
+    verses_block = "\n".join(
         f"{number}. {text}"
         for number, text in zip(verse_numbers, verse_texts, strict=False)
         if text
-    ]
+    )
     exclude_note = ", ".join(exclude_domains) if exclude_domains else "nenhum"
     variables = {
         "reference": reference,
-        "verses": "\n".join(verse_lines),
+        "verses": verses_block,
         "max_sources": max_sources,
         "exclude_note": exclude_note,
     }
     prompt_config = _get_lexical_prompt_config()
-    instruction = _render_template(
-        str(prompt_config.get("system_template")), variables
-    ).strip()
-    user_query = _render_template(
-        str(prompt_config.get("human_template")), variables
-    ).strip()
+    instruction = render_segments(prompt_config["_system_segments"], variables).strip()
+    user_query = render_segments(prompt_config["_human_segments"], variables).strip()
 
     return (
         instruction,
@@ -391,121 +547,101 @@ async def _run_adk_grounding_async(
     timeout_seconds: float,
     afc_max_remote_calls: int,
 ) -> tuple[str, list[dict], int, dict]:
-    from google.adk.agents import Agent
-    from google.adk.runners import Runner
-    from google.adk.sessions import InMemorySessionService
-    from google.adk.tools import google_search
-    from google.genai import types
-
-    app_name = "theological_agent_lexical_grounding"
-    user_id = "lexical_grounding_user"
-    session_id = str(uuid.uuid4())
-
-    root_agent = Agent(
-        name="lexical_grounding_agent",
-        model=model_name,
-        description="Grounded lexical helper for theological exegesis.",
-        instruction=instruction,
-        generate_content_config=types.GenerateContentConfig(
-            automatic_function_calling=types.AutomaticFunctionCallingConfig(
-                maximum_remote_calls=afc_max_remote_calls
-            )
-        ),
-        tools=[google_search],
-    )
-
-    session_service = InMemorySessionService()
+    if not _ADK_AVAILABLE:
+        raise RuntimeError("google-adk package is not available")
+
+    cache_key = (model_name, afc_max_remote_calls)
+    with _runner_cache_lock:
+        cached = _runner_cache.get(cache_key)
+        if cached is not None:
+            _runner_cache.move_to_end(cache_key)
+
+    if cached is None:
+        root_agent = Agent(
+            name="lexical_grounding_agent",
+            model=model_name,
+            description="Grounded lexical helper for theological exegesis.",
+            instruction=ADK_AGENT_INSTRUCTION,
+            generate_content_config=types.GenerateContentConfig(
+                automatic_function_calling=types.AutomaticFunctionCallingConfig(
+                    maximum_remote_calls=afc_max_remote_calls
+                )
+            ),
+            tools=[google_search],
+        )
+        session_service = InMemorySessionService()
+        runner = Runner(
+            agent=root_agent, app_name=ADK_APP_NAME, session_service=session_service
+        )
+        cached = (runner, session_service)
+        with _runner_cache_lock:
+            _runner_cache[cache_key] = cached
+            while len(_runner_cache) > RUNNER_CACHE_MAX:
+                _runner_cache.popitem(last=False)
+
+    runner, session_service = cached
+    session_id = secrets.token_hex(8)
     await session_service.create_session(
-        app_name=app_name, user_id=user_id, session_id=session_id
-    )
-    runner = Runner(
-        agent=root_agent, app_name=app_name, session_service=session_service
+        app_name=ADK_APP_NAME, user_id=ADK_USER_ID, session_id=session_id
     )
 
-    user_message = types.Content(role="user", parts=[types.Part(text=user_query)])
+    user_message = types.Content(
+        role="user", parts=[types.Part(text=instruction), types.Part(text=user_query)]
+    )
     events = runner.run_async(
-        user_id=user_id, session_id=session_id, new_message=user_message
+        user_id=ADK_USER_ID, session_id=session_id, new_message=user_message
     )
 
     async def collect() -> tuple[str, list[dict], int, dict]:
         final_text = ""
-        raw_events: list[Any] = []
-        async for event in events:
-            raw_events.append(event)
-            if hasattr(event, "is_final_response") and event.is_final_response():
-                maybe_text = _extract_text_from_event(event)
-                if maybe_text:
-                    final_text = maybe_text
-
-        payload = _to_primitive(raw_events)
-        sources = _extract_sources_from_payload(payload)
-        search_calls = _estimate_search_calls(payload, source_count=len(sources))
-        tokens = _extract_tokens_from_payload(payload)
-        return final_text, sources, search_calls, tokens
-
-    return await asyncio.wait_for(collect(), timeout=timeout_seconds)
-
-
-def _estimate_search_calls(payload: Any, source_count: int = 0) -> int:
-    """
-    Best-effort search call count extracted from ADK event payload.
-    """
-    serialized = str(payload).lower()
-    search_call_hits = len(re.findall(r"google_search_call", serialized))
-    tool_name_hits = len(re.findall(r"name['\"]?:\s*['\"]google_search", serialized))
-    total = max(search_call_hits, tool_name_hits)
-    if total == 0 and source_count > 0:
-        total = 1
-    return total
+        state = _ExtractionState()
+        # aclosing() shuts the runner's generator down when we stop early
+        async with contextlib.aclosing(events) as stream:
+            async for event in stream:
+                _extract_all_from_event(event, state)
+                if hasattr(event, "is_final_response") and event.is_final_response():
+                    maybe_text = _extract_text_from_event(event)
+                    if maybe_text:
+                        final_text = maybe_text
+                        break
+
+        return final_text.strip(), state.sources, state.search_calls, state.usage
 
+    try:
+        async with asyncio.timeout(timeout_seconds):
+            return await collect()
+    finally:
+        # The session service outlives the call, so drop the per-call session
+        try:
+            await session_service.delete_session(
+                app_name=ADK_APP_NAME, user_id=ADK_USER_ID, session_id=session_id
+            )
+        except Exception:
+            pass
 
-def _extract_tokens_from_payload(payload: Any) -> dict:
-    usage = {"input": 0, "output": 0}
-    seen_metadata = set()
 
-    def visit(node: Any) -> None:
-        if isinstance(node, dict):
-            # Google GenAI `usage_metadata` struct (standard or camelCase)
-            if "prompt_token_count" in node or "promptTokenCount" in node:
-                # Use object id to avoid double counting if the same metadata appears
-                # twice in the tree (e.g., inside 'model_response' and 'event')
-                node_id = id(node)
-                if node_id not in seen_metadata:
-                    seen_metadata.add(node_id)
-                    in_toks = (
-                        node.get("prompt_token_count")
-                        or node.get("promptTokenCount")
-                        or 0
-                    )
-                    out_toks = (
-                        node.get("candidates_token_count")
-                        or node.get("candidatesTokenCount")
-                        or 0
-                    )
-                    usage["input"] += int(in_toks)
-                    usage["output"] += int(out_toks)
-                return  # Stop recursion for this node
+def reset_runner_cache() -> None:
+    """Drop cached ADK runners (e.g. after a prompt or model change)."""
+    with _runner_cache_lock:
+        _runner_cache.clear()
 
-            for child in node.values():
-                visit(child)
-        elif isinstance(node, list):
-            for item in node:
-                visit(item)
 
-    visit(payload)
-    return usage
+_REPORT_SECTION_RE = re.compile(r"(lemas)|(evid[eê]ncias)|(fontes)", re.IGNORECASE)
 
 
 def _looks_like_lexical_report(markdown: str, min_chars: int) -> bool:
-    content = (markdown or "").strip()
+    """Quality gate for an already-stripped ADK report."""
+    content = markdown or ""
     if len(content) < min_chars:
         return False
 
-    lower = content.lower()
-    has_lemas = "lemas" in lower
-    has_evidencias = ("evidências" in lower) or ("evidencias" in lower)
-    has_fontes = "fontes" in lower
-    return has_lemas and has_evidencias and has_fontes
+    # One scan for all three section markers, stopping once each was seen
+    found: set[int] = set()
+    for match in _REPORT_SECTION_RE.finditer(content):
+        found.add(match.lastindex)
+        if len(found) == 3:
+            return True
+    return False
 
 
 def _build_grounded_context(sources: list[dict], max_chars: int = 1200) -> str:
@@ -518,6 +654,9 @@ def _build_grounded_context(sources: list[dict], max_chars: int = 1200) -> str:
     if not sources:
         return ""
 
+    header = "Fontes grounding consultadas:\n"
+    remaining = max_chars - len(header)
+    truncated = False
     chunks: list[str] = []
     for src in sources:
         title = (src.get("title") or "").strip()
@@ -527,179 +666,284 @@ def _build_grounded_context(sources: list[dict], max_chars: int = 1200) -> str:
         line = f"- {title} ({url})"
         if snippet:
             line += f"\n  {snippet}"
-        chunks.append(line)
-
-    context = "Fontes grounding consultadas:\n" + "\n".join(chunks)
-    if len(context) <= max_chars:
-        return context
-    return context[:max_chars].rstrip() + "..."
 
+        # Stop at the budget instead of building everything and slicing
+        cost = len(line) + (1 if chunks else 0)
+        if cost > remaining:
+            if not chunks:
+                chunks.append(line[: max(remaining, 0)].rstrip())
+            truncated = True
+            break
+        chunks.append(line)
+        remaining -= cost
 
-def _run_coro_sync(coro, timeout_seconds: float = 30.0):
-    try:
-        return asyncio.run(coro)
-    except RuntimeError as err:
-        if "asyncio.run() cannot be called from a running event loop" not in str(err):
-            raise
-
-        result: dict[str, Any] = {}
-        error: dict[str, Exception] = {}
-
-        def target():
-            try:
-                result["value"] = asyncio.run(coro)
-            except Exception as thread_err:  # pragma: no cover
-                error["value"] = thread_err
-
-        thread = threading.Thread(target=target, daemon=True)
-        thread.start()
-        thread.join(timeout=timeout_seconds)
-        if thread.is_alive():
-            raise TimeoutError(
-                f"ADK grounding thread exceeded {timeout_seconds:.1f}s timeout"
-            )
-        if "value" in error:
-            raise error["value"]
-        return result.get("value")
+    context = header + "\n".join(chunks)
+    return context + "..." if truncated else context
 
 
-@traceable(name="adk_lexical_agent", run_type="chain")
-def run_lexical_grounding(
-    book: str, chapter: int, verses: list[str]
-) -> LexicalGroundingResult:
+def _get_adk_loop() -> asyncio.AbstractEventLoop:
     """
-    Generate grounded lexical context using ADK + Google Search.
+    Lazily start the long-lived event loop that serves sync callers.
 
-    Returns a non-throwing result. On failures, `used_grounding=False` and
-    `error` is populated so callers can fallback to legacy prompt logic.
+    A single loop (instead of one `asyncio.run` per call) lets loop-bound
+    ADK/GenAI async clients be reused across requests.
     """
-    provider = "adk_google_search"
-    timeout_ms = _parse_int_env("LEXICAL_GROUNDING_TIMEOUT_MS", 35000)
-    max_sources = _parse_int_env("LEXICAL_GROUNDING_MAX_SOURCES", 5)
-    afc_max_remote_calls = _parse_int_env("LEXICAL_ADK_AFC_MAX_REMOTE_CALLS", 3)
-    min_report_chars = _parse_int_env("LEXICAL_ADK_MIN_REPORT_CHARS", 300)
-    exclude_domains = _parse_csv_env("LEXICAL_GROUNDING_EXCLUDE_DOMAINS")
-    timeout_seconds = timeout_ms / 1000.0
-    started = time.time()
-
+    global _adk_loop
+    if _adk_loop is None:
+        with _adk_loop_lock:
+            if _adk_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="adk-event-loop", daemon=True
+                ).start()
+                _adk_loop = loop
+    return _adk_loop
+
+
+@dataclass(frozen=True)
+class _GroundingRequest:
+    """Everything the ADK runner needs, resolved before it is scheduled."""
+
+    instruction: str
+    user_query: str
+    model_name: str
+    prompt_source: str
+    prompt_commit_hash: str | None
+
+
+def _log_grounding_config(config: LexicalGroundingConfig) -> None:
     logger.info(
         "Lexical grounding config: "
-        f"timeout={timeout_ms}ms, max_sources={max_sources}, "
-        f"afc_max_remote_calls={afc_max_remote_calls}, "
-        f"min_report_chars={min_report_chars}, exclude_domains={exclude_domains}",
+        f"timeout={config.timeout_ms}ms, max_sources={config.max_sources}, "
+        f"afc_max_remote_calls={config.afc_max_remote_calls}, "
+        f"min_report_chars={config.min_report_chars}, "
+        f"exclude_domains={config.exclude_domains}",
         extra={"event": "lexical_grounding_config"},
     )
 
-    try:
-        if not os.getenv("GOOGLE_API_KEY"):
-            raise ValueError(
-                "GOOGLE_API_KEY is not set. ADK lexical grounding requires this env var."
-            )
 
-        verse_numbers = [int(v) for v in verses if str(v).strip().isdigit()]
-        if not verse_numbers:
-            raise ValueError("No valid verse numbers to build grounding context.")
+def _prepare_grounding_request(
+    book: str, chapter: int, verses: list[str], config: LexicalGroundingConfig
+) -> _GroundingRequest:
+    """
+    Blocking preparation: verse lookup and prompt resolution (which may pull
+    from the Hub). Kept off the shared ADK loop so it never stalls other
+    in-flight grounding calls or eats into their timeouts.
+    """
+    if not config.google_api_key_present:
+        raise ValueError(
+            "GOOGLE_API_KEY is not set. ADK lexical grounding requires this env var."
+        )
 
-        verse_texts = get_specific_verses(book, chapter, verse_numbers)
-        if not verse_texts:
-            raise ValueError(
-                f"Unable to load verse text from NAA for {book} {chapter}:{verse_numbers}."
-            )
+    verse_numbers = [int(v) for v in verses if str(v).strip().isdigit()]
+    if not verse_numbers:
+        raise ValueError("No valid verse numbers to build grounding context.")
 
-        instruction, user_query, prompt_source, prompt_commit_hash, model_override = _build_adk_prompt(
-            book=book,
-            chapter=chapter,
-            verse_numbers=verse_numbers,
-            verse_texts=verse_texts,
-            max_sources=max_sources,
-            exclude_domains=exclude_domains,
-        )
-        logger.info(
-            "Lexical ADK prompt resolved",
-            extra={
-                "event": "lexical_prompt_resolved",
-                "prompt_name": PROMPT_NAME,
-                "prompt_source": prompt_source,
-                "prompt_commit_hash": prompt_commit_hash,
-            },
+    verse_texts = get_specific_verses(book, chapter, verse_numbers)
+    if not verse_texts:
+        raise ValueError(
+            f"Unable to load verse text from NAA for {book} {chapter}:{verse_numbers}."
         )
 
-        model_to_use = model_override or "gemini-3.1-flash-lite-preview"
+    instruction, user_query, prompt_source, prompt_commit_hash, model_override = _build_adk_prompt(
+        book=book,
+        chapter=chapter,
+        verse_numbers=verse_numbers,
+        verse_texts=verse_texts,
+        max_sources=config.max_sources,
+        exclude_domains=config.exclude_domains,
+    )
+    logger.info(
+        "Lexical ADK prompt resolved",
+        extra={
+            "event": "lexical_prompt_resolved",
+            "prompt_name": PROMPT_NAME,
+            "prompt_source": prompt_source,
+            "prompt_commit_hash": prompt_commit_hash,
+        },
+    )
 
-        grounded_text, sources, search_calls, tokens_consumed = _run_coro_sync(
-            _run_adk_grounding_async(
-                instruction=instruction,
-                user_query=user_query,
-                model_name=model_to_use,
-                timeout_seconds=timeout_seconds,
-                afc_max_remote_calls=afc_max_remote_calls,
-            ),
-            timeout_seconds=timeout_seconds,
-        )
+    return _GroundingRequest(
+        instruction=instruction,
+        user_query=user_query,
+        model_name=model_override or "gemini-3.1-flash-lite-preview",
+        prompt_source=prompt_source,
+        prompt_commit_hash=prompt_commit_hash,
+    )
 
-        if not grounded_text or not grounded_text.strip():
-            raise ValueError("ADK returned empty grounded lexical content.")
-        if not _looks_like_lexical_report(grounded_text, min_report_chars):
-            raise ValueError(
-                "ADK lexical output did not pass minimum quality gate "
-                f"(min_chars={min_report_chars}, required headings)."
-            )
 
-        sources = _filter_sources(sources, exclude_domains)[:max_sources]
-        duration_ms = int((time.time() - started) * 1000)
-        cleaned_markdown = grounded_text.strip()
-        grounded_context = _build_grounded_context(sources)
+def _run_adk_for(
+    request: _GroundingRequest, config: LexicalGroundingConfig
+) -> Coroutine[Any, Any, tuple[str, list[dict], int, dict]]:
+    return _run_adk_grounding_async(
+        instruction=request.instruction,
+        user_query=request.user_query,
+        model_name=request.model_name,
+        timeout_seconds=config.timeout_seconds,
+        afc_max_remote_calls=config.afc_max_remote_calls,
+    )
 
-        logger.info(
-            "Lexical grounding completed",
-            extra={
-                "event": "lexical_grounding_success",
-                "duration_ms": duration_ms,
-                "search_calls": search_calls,
-                "sources_count": len(sources),
-                "tokens": tokens_consumed,
-                "provider": provider,
-            },
+
+def _grounding_success(
+    request: _GroundingRequest,
+    config: LexicalGroundingConfig,
+    adk_output: tuple[str, list[dict], int, dict],
+    started: float,
+) -> LexicalGroundingResult:
+    """Quality-gate the ADK output and build the result (raises on rejection)."""
+    grounded_text, sources, search_calls, tokens_consumed = adk_output
+    min_report_chars = config.min_report_chars
+
+    if not grounded_text:
+        raise ValueError("ADK returned empty grounded lexical content.")
+    if not _looks_like_lexical_report(grounded_text, min_report_chars):
+        raise ValueError(
+            "ADK lexical output did not pass minimum quality gate "
+            f"(min_chars={min_report_chars}, required headings)."
         )
 
-        return LexicalGroundingResult(
-            used_grounding=True,
-            lexical_report_markdown=cleaned_markdown,
-            grounded_lexical_context=grounded_context,
-            sources=sources,
-            provider=provider,
-            error=None,
-            duration_ms=duration_ms,
-            search_calls=search_calls,
-            tokens_consumed=tokens_consumed,
-            prompt_commit_hash=prompt_commit_hash,
-            prompt_source=prompt_source,
-            model_name=model_to_use,
+    sources = _filter_sources(sources, config.exclude_domains)[: config.max_sources]
+    duration_ms = int((time.time() - started) * 1000)
+    grounded_context = _build_grounded_context(sources)
+
+    logger.info(
+        "Lexical grounding completed",
+        extra={
+            "event": "lexical_grounding_success",
+            "duration_ms": duration_ms,
+            "search_calls": search_calls,
+            "sources_count": len(sources),
+            "tokens": tokens_consumed,
+            "provider": GROUNDING_PROVIDER,
+        },
+    )
+
+    return LexicalGroundingResult(
+        used_grounding=True,
+        lexical_report_markdown=grounded_text,
+        grounded_lexical_context=grounded_context,
+        sources=sources,
+        provider=GROUNDING_PROVIDER,
+        error=None,
+        duration_ms=duration_ms,
+        search_calls=search_calls,
+        tokens_consumed=tokens_consumed,
+        prompt_commit_hash=request.prompt_commit_hash,
+        prompt_source=request.prompt_source,
+        model_name=request.model_name,
+    )
+
+
+def _grounding_failure(
+    exc: BaseException, started: float, book: str, chapter: int, verses: list[str]
+) -> LexicalGroundingResult:
+    duration_ms = int((time.time() - started) * 1000)
+    error_detail = f"{type(exc).__name__}: {exc}" if str(exc) else repr(exc)
+    logger.warning(
+        f"Lexical grounding failed; using legacy fallback path: {error_detail}",
+        extra={
+            "event": "lexical_grounding_failed",
+            "error_type": type(exc).__name__,
+            "error_detail": error_detail,
+            "duration_ms": duration_ms,
+            "provider": GROUNDING_PROVIDER,
+            "book": book,
+            "chapter": chapter,
+            "verses": verses,
+        },
+    )
+    return LexicalGroundingResult(
+        used_grounding=False,
+        lexical_report_markdown="",
+        grounded_lexical_context="",
+        sources=[],
+        provider=GROUNDING_PROVIDER,
+        error=error_detail,
+        duration_ms=duration_ms,
+        search_calls=0,
+    )
+
+
+@traceable(name="adk_lexical_agent", run_type="chain")
+async def run_lexical_grounding_async(
+    book: str, chapter: int, verses: list[str]
+) -> LexicalGroundingResult:
+    """
+    Async entrypoint for callers already running inside an event loop.
+
+    Returns a non-throwing result. On failures, `used_grounding=False` and
+    `error` is populated so callers can fallback to legacy prompt logic.
+    """
+    config = _get_grounding_config()
+    started = time.time()
+    _log_grounding_config(config)
+
+    try:
+        request = await asyncio.to_thread(
+            _prepare_grounding_request, book, chapter, verses, config
         )
+        adk_output = await _run_adk_for(request, config)
+        return _grounding_success(request, config, adk_output, started)
+    except Exception as exc:
+        return _grounding_failure(exc, started, book, chapter, verses)
+
 
+@traceable(name="adk_lexical_agent", run_type="chain")
+def run_lexical_grounding(
+    book: str, chapter: int, verses: list[str]
+) -> LexicalGroundingResult:
+    """
+    Sync entrypoint (used by the LangGraph lexical node).
+
+    The blocking preparation (verse lookup, prompt resolution) runs in the
+    caller's thread; only the ADK runner coroutine is submitted to the shared
+    event loop, with the caller's context so tracing/logging context carries
+    over. The boundary wait is capped so a hung ADK call still degrades to
+    the legacy fallback path.
+    """
+    config = _get_grounding_config()
+    started = time.time()
+    _log_grounding_config(config)
+
+    try:
+        request = _prepare_grounding_request(book, chapter, verses, config)
     except Exception as exc:
-        duration_ms = int((time.time() - started) * 1000)
-        error_detail = f"{type(exc).__name__}: {exc}" if str(exc) else repr(exc)
+        return _grounding_failure(exc, started, book, chapter, verses)
+
+    timeout_seconds = config.timeout_seconds + SYNC_BOUNDARY_GRACE_SECONDS
+    future = contextvars.copy_context().run(
+        asyncio.run_coroutine_threadsafe,
+        _run_adk_for(request, config),
+        _get_adk_loop(),
+    )
+    try:
+        adk_output = future.result(timeout=timeout_seconds)
+    except TimeoutError as exc:
+        if future.done():
+            # Raised inside the runner (its own asyncio.timeout), not here
+            return _grounding_failure(exc, started, book, chapter, verses)
+        future.cancel()
+        error_detail = (
+            f"TimeoutError: ADK grounding exceeded {timeout_seconds:.1f}s "
+            "at the sync boundary"
+        )
         logger.warning(
             f"Lexical grounding failed; using legacy fallback path: {error_detail}",
-            extra={
-                "event": "lexical_grounding_failed",
-                "error_type": type(exc).__name__,
-                "error_detail": error_detail,
-                "duration_ms": duration_ms,
-                "provider": provider,
-                "book": book,
-                "chapter": chapter,
-                "verses": verses,
-            },
+            extra={"event": "lexical_grounding_failed", "error_type": "TimeoutError"},
         )
         return LexicalGroundingResult(
             used_grounding=False,
             lexical_report_markdown="",
             grounded_lexical_context="",
             sources=[],
-            provider=provider,
+            provider=GROUNDING_PROVIDER,
             error=error_detail,
-            duration_ms=duration_ms,
-            search_calls=0,
+            duration_ms=int((time.time() - started) * 1000),
         )
+    except Exception as exc:
+        return _grounding_failure(exc, started, book, chapter, verses)
+
+    try:
+        return _grounding_success(request, config, adk_output, started)
+    except Exception as exc:
+        return _grounding_failure(exc, started, book, chapter, verses)
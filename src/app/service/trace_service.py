@@ -7,95 +7,281 @@ trace metadata/status in PostgreSQL.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import gzip
 import json
 import os
+import queue
+import random
+import tempfile
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-from app.database.connection import get_connection
+from app.database.connection import get_trace_connection
 from app.utils.logger import get_logger
 
 try:
-    from langsmith import Client as LangSmithClient
-except ImportError:  # pragma: no cover
-    LangSmithClient = None
-
-try:
-    from supabase import create_client
+    import orjson
 except ImportError:  # pragma: no cover
-    create_client = None
+    orjson = None
 
-try:
-    from langchain_core.tracers.langchain import wait_for_all_tracers
-except ImportError:  # pragma: no cover
-    wait_for_all_tracers = None
+# langsmith, supabase and langchain_core are imported on first export so
+# processes with tracing disabled never load them
+if TYPE_CHECKING:  # pragma: no cover
+    from langsmith import Client as LangSmithClient
 
 logger = get_logger(__name__)
 
 _ls_client: LangSmithClient | None = None
 _supabase_client = None
-READ_RUN_RETRY_ATTEMPTS = 4
-READ_RUN_RETRY_DELAY_SECONDS = 2
-
-
-def _is_tracing_enabled() -> bool:
-    return os.getenv("LANGCHAIN_TRACING_V2", "").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "on",
-    }
+# Export workers race to build the clients; double-checked under this lock
+_client_lock = threading.Lock()
+READ_RUN_RETRY_ATTEMPTS = 6
+READ_RUN_RETRY_BASE_DELAY_SECONDS = 0.2
+READ_RUN_RETRY_MAX_DELAY_SECONDS = 4
+TRACE_GZIP_LEVEL = 5
+
+# Per-trace read/upload fan-out within a batch; built on the first batch,
+# sized from _cfg(), and atexit waits for in-flight uploads
+_export_pool: ThreadPoolExecutor | None = None
+_export_pool_lock = threading.Lock()
+
+# Jobs are (run_id, langsmith_run_id, future); None is the stop sentinel
+_export_queue: queue.Queue[tuple[str, str | None, Future] | None] = queue.Queue()
+_export_worker: threading.Thread | None = None
+_export_worker_lock = threading.Lock()
+
+# wait_for_all_tracers drains every tracer in the process, so one flush per
+# window serves all exports finishing within it
+TRACER_FLUSH_MIN_INTERVAL_SECONDS = 1.0
+_last_flush_ts = 0.0
+_flush_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class _TraceCfg:
+    """Trace export settings, read from env once per process."""
+
+    tracing_enabled: bool
+    langsmith_api_key_present: bool
+    supabase_project: str | None
+    supabase_secret_key: str | None
+    bucket: str
+    persist_skips: bool
+    # Child runs nested deeper than this are elided before encoding
+    max_depth: int
+    # Uncompressed JSON above this is re-encoded without child runs
+    max_bytes: int
+    batch_max_items: int
+    batch_max_wait_seconds: float
+    export_workers: int
+
+
+@functools.cache
+def _cfg() -> _TraceCfg:
+    return _TraceCfg(
+        tracing_enabled=os.getenv("LANGCHAIN_TRACING_V2", "").strip().lower()
+        in {"1", "true", "yes", "on"},
+        langsmith_api_key_present=bool(os.getenv("LANGSMITH_API_KEY")),
+        supabase_project=os.getenv("SUPABASE_PROJECT"),
+        supabase_secret_key=os.getenv("SUPABASE_SECRET_KEY"),
+        bucket=os.getenv("SUPABASE_TRACES_BUCKET", "traces").strip() or "traces",
+        persist_skips=os.getenv("TRACE_PERSIST_SKIPS", "0") == "1",
+        max_depth=int(os.getenv("TRACE_MAX_DEPTH", "8")),
+        max_bytes=int(os.getenv("TRACE_MAX_BYTES", "50000000")),
+        batch_max_items=int(os.getenv("TRACE_EXPORT_BATCH_SIZE", "32")),
+        batch_max_wait_seconds=float(
+            os.getenv("TRACE_EXPORT_BATCH_WAIT_SECONDS", "5")
+        ),
+        export_workers=int(os.getenv("TRACE_EXPORT_WORKERS", "4")),
+    )
 
 
 def _get_langsmith_client() -> LangSmithClient | None:
     global _ls_client
-    if LangSmithClient is None:
-        return None
     if _ls_client is None:
-        _ls_client = LangSmithClient()
+        try:
+            from langsmith import Client as LangSmithClient
+        except ImportError:  # pragma: no cover
+            return None
+        with _client_lock:
+            if _ls_client is None:
+                _ls_client = LangSmithClient()
     return _ls_client
 
 
 def _get_supabase_client():
     global _supabase_client
-    if create_client is None:
-        return None
-
-    project_url = os.getenv("SUPABASE_PROJECT")
-    secret_key = os.getenv("SUPABASE_SECRET_KEY")
+    cfg = _cfg()
+    project_url = cfg.supabase_project
+    secret_key = cfg.supabase_secret_key
     if not project_url or not secret_key:
         return None
 
     if _supabase_client is None:
-        _supabase_client = create_client(project_url, secret_key)
+        try:
+            from supabase import create_client
+        except ImportError:  # pragma: no cover
+            return None
+        with _client_lock:
+            if _supabase_client is None:
+                _supabase_client = create_client(project_url, secret_key)
     return _supabase_client
 
 
-def _serialize_run(run: Any) -> bytes:
+def _run_payload(run: Any) -> Any:
     if hasattr(run, "model_dump"):
-        payload = run.model_dump()
-    elif hasattr(run, "dict"):
-        payload = run.dict()
-    else:
-        payload = run
-    return json.dumps(payload, default=str).encode("utf-8")
+        return run.model_dump()
+    if hasattr(run, "dict"):
+        return run.dict()
+    return run
 
 
-def _read_langsmith_run_with_retry(
-    ls_client: LangSmithClient, langsmith_run_id: str
-):
-    if wait_for_all_tracers:
+def _dumps_value(value: Any) -> bytes:
+    try:
+        return orjson.dumps(
+            value,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    except TypeError:
+        # orjson.JSONEncodeError (e.g. ints wider than 64 bits) is a TypeError
+        return json.dumps(value, default=str).encode("utf-8")
+
+
+def _write_payload_orjson(payload: Any, out) -> None:
+    """
+    Write a run with orjson one top-level field (and one child run) at a
+    time, so no single encoded buffer covers the whole trace.
+    """
+    if not isinstance(payload, dict):
+        out.write(_dumps_value(payload))
+        return
+
+    out.write(b"{")
+    for index, (key, value) in enumerate(payload.items()):
+        if index:
+            out.write(b",")
+        out.write(_dumps_value(str(key)))
+        out.write(b":")
+        if isinstance(value, list) and key == "child_runs":
+            out.write(b"[")
+            for child_index, child in enumerate(value):
+                if child_index:
+                    out.write(b",")
+                out.write(_dumps_value(child))
+            out.write(b"]")
+        else:
+            out.write(_dumps_value(value))
+    out.write(b"}")
+
+
+def _elided_child_runs(child_runs: list) -> dict:
+    return {"_truncated": True, "original_count": len(child_runs)}
+
+
+def _prune_child_runs(payload: Any, max_depth: int) -> bool:
+    """
+    Replace `child_runs` nested at `max_depth` or deeper with an elided
+    marker, in place. Returns True when anything was pruned.
+    """
+    pruned = False
+    stack: list[tuple[Any, int]] = [(payload, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        child_runs = node.get("child_runs")
+        if not isinstance(child_runs, list) or not child_runs:
+            continue
+        if depth >= max_depth:
+            node["child_runs"] = _elided_child_runs(child_runs)
+            pruned = True
+        else:
+            stack.extend((child, depth + 1) for child in child_runs)
+    return pruned
+
+
+def _serialize_run_to_file(run: Any) -> tuple[str, int, int, bool]:
+    """
+    Stream-encode a run as gzipped JSON into a temp file, capped by
+    TRACE_MAX_DEPTH / TRACE_MAX_BYTES.
+
+    Chunks are written as they are produced (orjson per field/child run, or
+    the stdlib incremental encoder), so the full trace never exists as a
+    single bytes object in memory. The caller owns (and must delete) the file.
+
+    Returns:
+        Tuple (path, compressed size, uncompressed size, truncated).
+    """
+    cfg = _cfg()
+    payload = _run_payload(run)
+    truncated = _prune_child_runs(payload, cfg.max_depth)
+    path, size_bytes, uncompressed_bytes = _write_gzip_json(payload)
+
+    child_runs = payload.get("child_runs") if isinstance(payload, dict) else None
+    if uncompressed_bytes > cfg.max_bytes and isinstance(child_runs, list):
+        os.unlink(path)
+        payload["child_runs"] = _elided_child_runs(child_runs)
+        truncated = True
+        path, size_bytes, uncompressed_bytes = _write_gzip_json(payload)
+
+    return path, size_bytes, uncompressed_bytes, truncated
+
+
+def _write_gzip_json(payload: Any) -> tuple[str, int, int]:
+    """Write `payload` to a gzipped temp file; returns (path, gz size, raw size)."""
+    with tempfile.NamedTemporaryFile("wb", suffix=".json.gz", delete=False) as tmp:
         try:
+            with gzip.GzipFile(
+                fileobj=tmp, mode="wb", compresslevel=TRACE_GZIP_LEVEL
+            ) as out:
+                if orjson is not None:
+                    _write_payload_orjson(payload, out)
+                else:
+                    for chunk in json.JSONEncoder(default=str).iterencode(payload):
+                        out.write(chunk.encode("utf-8"))
+                uncompressed_bytes = out.tell()
+        except Exception:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    return tmp.name, os.path.getsize(tmp.name), uncompressed_bytes
+
+
+def _flush_tracers(langsmith_run_ids: list[str]) -> None:
+    """
+    Flush pending LangSmith tracer callbacks, at most once per
+    TRACER_FLUSH_MIN_INTERVAL_SECONDS across the process.
+    """
+    global _last_flush_ts
+    try:
+        from langchain_core.tracers.langchain import wait_for_all_tracers
+    except ImportError:  # pragma: no cover
+        return
+    try:
+        with _flush_lock:
+            if time.monotonic() - _last_flush_ts < TRACER_FLUSH_MIN_INTERVAL_SECONDS:
+                return
             wait_for_all_tracers()
-        except Exception as flush_err:
-            logger.warning(
-                f"LangSmith tracer flush failed before read_run: {flush_err}",
-                extra={
-                    "event": "trace_export_flush_failed",
-                    "langsmith_run_id": langsmith_run_id,
-                },
-            )
+            _last_flush_ts = time.monotonic()
+    except Exception as flush_err:
+        logger.warning(
+            f"LangSmith tracer flush failed before read_run: {flush_err}",
+            extra={
+                "event": "trace_export_flush_failed",
+                "langsmith_run_ids": langsmith_run_ids,
+            },
+        )
+
 
+def _read_langsmith_run_with_retry(
+    ls_client: LangSmithClient, langsmith_run_id: str
+):
     last_err: Exception | None = None
     for attempt in range(1, READ_RUN_RETRY_ATTEMPTS + 1):
         try:
@@ -103,6 +289,11 @@ def _read_langsmith_run_with_retry(
         except Exception as err:
             last_err = err
             if attempt < READ_RUN_RETRY_ATTEMPTS:
+                # Exponential backoff with jitter so concurrent exporters spread out
+                delay = min(
+                    READ_RUN_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1),
+                    READ_RUN_RETRY_MAX_DELAY_SECONDS,
+                ) * random.uniform(0.5, 1.5)
                 logger.info(
                     "LangSmith run not yet available; retrying read_run",
                     extra={
@@ -110,10 +301,10 @@ def _read_langsmith_run_with_retry(
                         "langsmith_run_id": langsmith_run_id,
                         "attempt": attempt,
                         "max_attempts": READ_RUN_RETRY_ATTEMPTS,
-                        "sleep_seconds": READ_RUN_RETRY_DELAY_SECONDS,
+                        "sleep_seconds": round(delay, 3),
                     },
                 )
-                time.sleep(READ_RUN_RETRY_DELAY_SECONDS)
+                time.sleep(delay)
 
     raise RuntimeError(
         f"LangSmith run not found after {READ_RUN_RETRY_ATTEMPTS} attempts: "
@@ -121,24 +312,56 @@ def _read_langsmith_run_with_retry(
     )
 
 
-def _upsert_trace_status(
+_TRACE_STATUS_COLUMNS = (
+    "run_id",
+    "langsmith_run_id",
+    "storage_path",
+    "size_bytes",
+    "status",
+    "error_message",
+)
+
+
+def _trace_status_row(
     run_id: str,
     langsmith_run_id: str | None,
     status: str,
     storage_path: str | None = None,
     size_bytes: int | None = None,
     error_message: str | None = None,
-) -> None:
+) -> dict:
+    return {
+        "run_id": run_id,
+        "langsmith_run_id": langsmith_run_id,
+        "storage_path": storage_path,
+        "size_bytes": size_bytes,
+        "status": status,
+        "error_message": error_message,
+    }
+
+
+def _upsert_trace_statuses(rows: list[dict]) -> None:
+    """
+    Persist trace statuses with one multi-row INSERT ... ON CONFLICT.
+
+    psycopg 3 has no `execute_values`, so the VALUES list is expanded with one
+    placeholder group per row; a batch costs a single round-trip.
+    """
+    if not rows:
+        return
+
+    # ON CONFLICT cannot touch the same row twice in one statement; last wins
+    deduped = list({row["run_id"]: row for row in rows}.values())
+    row_placeholders = "(" + ", ".join(["%s"] * len(_TRACE_STATUS_COLUMNS)) + ")"
+    values_sql = ", ".join([row_placeholders] * len(deduped))
+    params = [row[column] for row in deduped for column in _TRACE_STATUS_COLUMNS]
     try:
-        with get_connection() as conn:
+        with get_trace_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
-                    """
-                    INSERT INTO graph_run_traces (
-                        run_id, langsmith_run_id, storage_path, size_bytes, status, error_message
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s
-                    )
+                    f"""
+                    INSERT INTO graph_run_traces ({", ".join(_TRACE_STATUS_COLUMNS)})
+                    VALUES {values_sql}
                     ON CONFLICT (run_id) DO UPDATE SET
                         langsmith_run_id = EXCLUDED.langsmith_run_id,
                         storage_path = EXCLUDED.storage_path,
@@ -146,14 +369,7 @@ def _upsert_trace_status(
                         status = EXCLUDED.status,
                         error_message = EXCLUDED.error_message
                     """,
-                    (
-                        run_id,
-                        langsmith_run_id,
-                        storage_path,
-                        size_bytes,
-                        status,
-                        error_message,
-                    ),
+                    params,
                 )
             conn.commit()
     except Exception as db_err:
@@ -161,135 +377,100 @@ def _upsert_trace_status(
             f"Failed to upsert graph trace status: {db_err}",
             extra={
                 "event": "trace_status_upsert_failed",
-                "run_id": run_id,
-                "langsmith_run_id": langsmith_run_id,
-                "trace_status": status,
+                "run_ids": [row["run_id"] for row in deduped],
+                "trace_statuses": [row["status"] for row in deduped],
             },
         )
 
 
-def export_graph_trace(run_id: str, langsmith_run_id: str | None) -> None:
+def _skip_reason(langsmith_run_id: str | None) -> tuple[str, str, bool] | None:
     """
-    Export full LangSmith trace to Supabase Storage for a completed graph run.
-
-    This function is intentionally non-blocking for the request lifecycle:
-    all exceptions are handled internally and logged.
+    Return (reason, log message, is_warning) when a trace cannot be exported,
+    or None when export can proceed.
     """
+    cfg = _cfg()
     if not langsmith_run_id:
-        reason = "langsmith_run_id not provided"
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=None,
-            status="skipped",
-            error_message=reason,
-        )
-        logger.warning(
+        return (
+            "langsmith_run_id not provided",
             "Skipping graph trace export: missing LangSmith run id",
-            extra={"event": "trace_export_skipped", "run_id": run_id, "reason": reason},
-        )
-        return
-
-    if not _is_tracing_enabled():
-        reason = "LANGCHAIN_TRACING_V2 is disabled"
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="skipped",
-            error_message=reason,
+            True,
         )
-        logger.info(
+    if not cfg.tracing_enabled:
+        return (
+            "LANGCHAIN_TRACING_V2 is disabled",
             "Skipping graph trace export: tracing disabled",
-            extra={
-                "event": "trace_export_skipped",
-                "run_id": run_id,
-                "langsmith_run_id": langsmith_run_id,
-                "reason": reason,
-            },
-        )
-        return
-
-    if not os.getenv("LANGSMITH_API_KEY"):
-        reason = "LANGSMITH_API_KEY not configured"
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="skipped",
-            error_message=reason,
+            False,
         )
-        logger.warning(
+    if not cfg.langsmith_api_key_present:
+        return (
+            "LANGSMITH_API_KEY not configured",
             "Skipping graph trace export: LangSmith API key missing",
-            extra={
-                "event": "trace_export_skipped",
-                "run_id": run_id,
-                "langsmith_run_id": langsmith_run_id,
-                "reason": reason,
-            },
-        )
-        return
-
-    ls_client = _get_langsmith_client()
-    if ls_client is None:
-        reason = "langsmith package not installed"
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="skipped",
-            error_message=reason,
+            True,
         )
-        logger.warning(
+    if _get_langsmith_client() is None:
+        return (
+            "langsmith package not installed",
             "Skipping graph trace export: langsmith dependency unavailable",
-            extra={
-                "event": "trace_export_skipped",
-                "run_id": run_id,
-                "langsmith_run_id": langsmith_run_id,
-                "reason": reason,
-            },
+            True,
         )
-        return
-
-    supabase = _get_supabase_client()
-    if supabase is None:
-        reason = "SUPABASE_PROJECT/SUPABASE_SECRET_KEY missing or supabase package unavailable"
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="skipped",
-            error_message=reason,
-        )
-        logger.warning(
+    if _get_supabase_client() is None:
+        return (
+            "SUPABASE_PROJECT/SUPABASE_SECRET_KEY missing or supabase package unavailable",
             "Skipping graph trace export: Supabase configuration unavailable",
-            extra={
-                "event": "trace_export_skipped",
-                "run_id": run_id,
-                "langsmith_run_id": langsmith_run_id,
-                "reason": reason,
-            },
+            True,
         )
-        return
+    return None
+
 
-    bucket = os.getenv("SUPABASE_TRACES_BUCKET", "traces").strip() or "traces"
-    object_path = f"{run_id}.json"
+def _trace_object_path(run_id: str) -> str:
+    return f"{run_id}.json.gz"
+
+
+def _export_one(
+    ls_client: LangSmithClient,
+    supabase,
+    bucket: str,
+    run_id: str,
+    langsmith_run_id: str,
+) -> dict:
+    """Read, serialize and upload one trace; returns its status row."""
+    object_path = _trace_object_path(run_id)
     storage_path = f"{bucket}/{object_path}"
 
     try:
         run = _read_langsmith_run_with_retry(ls_client, langsmith_run_id)
-        trace_json = _serialize_run(run)
-        size_bytes = len(trace_json)
-
-        supabase.storage.from_(bucket).upload(
-            path=object_path,
-            file=trace_json,
-            file_options={"content-type": "application/json", "upsert": "true"},
+        trace_file, size_bytes, uncompressed_bytes, truncated = (
+            _serialize_run_to_file(run)
         )
+        del run
+        if truncated:
+            cfg = _cfg()
+            logger.warning(
+                "Graph trace truncated before upload",
+                extra={
+                    "event": "trace_export_truncated",
+                    "run_id": run_id,
+                    "langsmith_run_id": langsmith_run_id,
+                    "uncompressed_bytes": uncompressed_bytes,
+                    "max_depth": cfg.max_depth,
+                    "max_bytes": cfg.max_bytes,
+                },
+            )
+        try:
+            # A BufferedReader lets the storage client stream the body
+            with open(trace_file, "rb") as trace_stream:
+                supabase.storage.from_(bucket).upload(
+                    path=object_path,
+                    file=trace_stream,
+                    file_options={
+                        "content-type": "application/json",
+                        "content-encoding": "gzip",
+                        "upsert": "true",
+                    },
+                )
+        finally:
+            os.unlink(trace_file)
 
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="uploaded",
-            storage_path=storage_path,
-            size_bytes=size_bytes,
-            error_message=None,
-        )
         logger.info(
             "Graph trace exported",
             extra={
@@ -298,16 +479,17 @@ def export_graph_trace(run_id: str, langsmith_run_id: str | None) -> None:
                 "langsmith_run_id": langsmith_run_id,
                 "storage_path": storage_path,
                 "size_bytes": size_bytes,
+                "uncompressed_bytes": uncompressed_bytes,
             },
         )
-    except Exception as err:
-        _upsert_trace_status(
-            run_id=run_id,
-            langsmith_run_id=langsmith_run_id,
-            status="failed",
+        return _trace_status_row(
+            run_id,
+            langsmith_run_id,
+            "uploaded_truncated" if truncated else "uploaded",
             storage_path=storage_path,
-            error_message=str(err),
+            size_bytes=size_bytes,
         )
+    except Exception as err:
         logger.error(
             f"Graph trace export failed: {err}",
             extra={
@@ -317,3 +499,202 @@ def export_graph_trace(run_id: str, langsmith_run_id: str | None) -> None:
                 "storage_path": storage_path,
             },
         )
+        return _trace_status_row(
+            run_id,
+            langsmith_run_id,
+            "failed",
+            storage_path=storage_path,
+            error_message=str(err),
+        )
+
+
+def _get_export_pool() -> ThreadPoolExecutor:
+    global _export_pool
+    if _export_pool is None:
+        with _export_pool_lock:
+            if _export_pool is None:
+                _export_pool = ThreadPoolExecutor(
+                    max_workers=_cfg().export_workers,
+                    thread_name_prefix="trace-export",
+                )
+                atexit.register(_export_pool.shutdown, wait=True)
+    return _export_pool
+
+
+def _submit_export(fn, *args) -> Future:
+    """
+    Submit to the export pool, or run inline once the pool has been shut
+    down (interpreter exit), so a final batch is still exported.
+    """
+    try:
+        return _get_export_pool().submit(fn, *args)
+    except RuntimeError:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as err:
+            future.set_exception(err)
+        return future
+
+
+def _export_batch(jobs: list[tuple[str, str | None]]) -> None:
+    """
+    Export a batch of traces: one tracer flush, concurrent read/upload per
+    trace, then one status upsert for the whole batch.
+
+    While the uploads run, the batch's runs are recorded as "uploading" (plus
+    any persisted skips) on the same pool, so that write overlaps the upload
+    I/O instead of adding to it.
+    """
+    rows: list[dict] = []
+    pending: list[tuple[str, str]] = []
+    for run_id, langsmith_run_id in jobs:
+        skip = _skip_reason(langsmith_run_id)
+        if skip is None:
+            pending.append((run_id, langsmith_run_id))
+            continue
+
+        reason, message, is_warning = skip
+        # Skips are logged always but only written to the DB when opted in
+        if _cfg().persist_skips:
+            rows.append(
+                _trace_status_row(
+                    run_id, langsmith_run_id, "skipped", error_message=reason
+                )
+            )
+        log = logger.warning if is_warning else logger.info
+        log(
+            message,
+            extra={
+                "event": "trace_export_skipped",
+                "run_id": run_id,
+                "langsmith_run_id": langsmith_run_id,
+                "reason": reason,
+            },
+        )
+
+    if pending:
+        ls_client = _get_langsmith_client()
+        supabase = _get_supabase_client()
+        bucket = _cfg().bucket
+
+        _flush_tracers([langsmith_run_id for _, langsmith_run_id in pending])
+        in_flight_rows = rows + [
+            _trace_status_row(
+                run_id,
+                langsmith_run_id,
+                "uploading",
+                storage_path=f"{bucket}/{_trace_object_path(run_id)}",
+            )
+            for run_id, langsmith_run_id in pending
+        ]
+        # Submitted first so it is not queued behind the uploads
+        in_flight_write = _submit_export(_upsert_trace_statuses, in_flight_rows)
+        futures = [
+            _submit_export(
+                _export_one, ls_client, supabase, bucket, run_id, langsmith_run_id
+            )
+            for run_id, langsmith_run_id in pending
+        ]
+        wait([in_flight_write, *futures])
+        # Final statuses land after the "uploading" write, never before it
+        rows = [future.result() for future in futures]
+
+    _upsert_trace_statuses(rows)
+
+
+def _drain_batch() -> list[tuple[str, str | None, Future]] | None:
+    """
+    Block for the next job, then collect more until the batch is full or the
+    batch window closes. Returns None once the stop sentinel is reached.
+    """
+    first = _export_queue.get()
+    if first is None:
+        return None
+
+    cfg = _cfg()
+    batch = [first]
+    deadline = time.monotonic() + cfg.batch_max_wait_seconds
+    while len(batch) < cfg.batch_max_items:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            job = _export_queue.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if job is None:
+            # Put the sentinel back so the loop stops after this batch
+            _export_queue.put(None)
+            break
+        batch.append(job)
+    return batch
+
+
+def _export_worker_loop() -> None:
+    while True:
+        batch = _drain_batch()
+        if batch is None:
+            return
+        try:
+            _export_batch([(run_id, ls_run_id) for run_id, ls_run_id, _ in batch])
+        except Exception as err:
+            logger.error(
+                f"Graph trace export batch failed: {err}",
+                extra={"event": "trace_export_batch_failed", "batch_size": len(batch)},
+            )
+        for _, _, future in batch:
+            future.set_result(None)
+
+
+def _stop_export_worker() -> None:
+    """Flush queued exports before the interpreter exits."""
+    worker = _export_worker
+    if worker is None:
+        return
+    _export_queue.put(None)
+    worker.join(timeout=_cfg().batch_max_wait_seconds + 30)
+
+
+def _ensure_export_worker() -> None:
+    global _export_worker
+    if _export_worker is None:
+        with _export_worker_lock:
+            if _export_worker is None:
+                worker = threading.Thread(
+                    target=_export_worker_loop,
+                    name="trace-export-batcher",
+                    daemon=True,
+                )
+                worker.start()
+                # concurrent.futures stops accepting work before atexit
+                # handlers run; _submit_export then exports the final batch
+                # inline, so nothing queued is lost at shutdown
+                atexit.register(_stop_export_worker)
+                _export_worker = worker
+
+
+def schedule_graph_trace_export(
+    run_id: str, langsmith_run_id: str | None
+) -> Future:
+    """
+    Queue a trace export for the background batcher and return immediately.
+
+    Callers on the request path should use this instead of calling
+    `export_graph_trace` directly. The returned future resolves once the
+    batch containing this run has been processed.
+    """
+    _ensure_export_worker()
+    future: Future = Future()
+    _export_queue.put((run_id, langsmith_run_id, future))
+    return future
+
+
+def export_graph_trace(run_id: str, langsmith_run_id: str | None) -> None:
+    """
+    Export full LangSmith trace to Supabase Storage for a completed graph run.
+
+    This function is intentionally non-blocking for the request lifecycle:
+    all exceptions are handled internally and logged.
+    """
+    _export_batch([(run_id, langsmith_run_id)])
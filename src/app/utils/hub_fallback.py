@@ -11,30 +11,119 @@ Fallback: If Hub is unavailable, load prompt text + model config from the
 
 import json
 import os
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
-from langsmith import Client
-from langchain_core.messages import SystemMessage, HumanMessage
 from app.client.client import get_llm_client
 from app.utils.logger import get_logger
+from app.utils.prompt_template import compile_template, render_segments
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from langsmith import Client
 
 logger = get_logger(__name__)
 
 # Reuse the LangSmith client across calls
-_ls_client: Client | None = None
+_ls_client: "Client | None" = None
+_ls_client_lock = threading.Lock()
 
 FALLBACK_FILE = os.path.join(
     os.path.dirname(__file__), "fallbacks", "prompts_fallback.json"
 )
+# (mtime, parsed JSON, compiled templates) of FALLBACK_FILE; rebuilt only when
+# the file changes. Templates are stored per prompt as (system, human) segments.
+_fallback_cache: tuple[float, dict, dict] | None = None
+# prompt_name -> (monotonic pull time, pulled chain)
+_PROMPT_CACHE: dict[str, tuple[float, Any]] = {}
+PROMPT_CACHE_TTL_SECONDS = float(os.getenv("LANGSMITH_PROMPT_TTL", "300"))
 
 
-def _get_ls_client() -> Client:
+def _get_ls_client() -> "Client":
+    """
+    Lazily import and build the LangSmith client. Raises ImportError when
+    langsmith is not installed, which sends callers to the JSON fallback.
+    """
     global _ls_client
     if _ls_client is None:
-        _ls_client = Client()
+        from langsmith import Client
+
+        # Parallel graph branches can get here together; build only one client
+        with _ls_client_lock:
+            if _ls_client is None:
+                _ls_client = Client()
     return _ls_client
 
 
+def _cached_pull(prompt_name: str):
+    """
+    Pull a prompt chain from the Hub, reusing it for PROMPT_CACHE_TTL_SECONDS.
+
+    If a refresh fails while an expired entry exists, the stale chain is
+    served (stale-while-revalidate) and the next call retries the pull.
+    """
+    cached = _PROMPT_CACHE.get(prompt_name)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < PROMPT_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    try:
+        chain = _get_ls_client().pull_prompt(
+            prompt_name, include_model=True, secrets_from_env=True
+        )
+    except Exception as pull_err:
+        if cached is None:
+            raise
+        logger.warning(
+            f"Hub refresh failed for '{prompt_name}'; serving cached prompt.",
+            extra={
+                "event": "hub_prompt_stale_served",
+                "prompt": prompt_name,
+                "error": str(pull_err),
+                "age_seconds": round(now - cached[0], 1),
+            },
+        )
+        return cached[1]
+
+    _PROMPT_CACHE[prompt_name] = (now, chain)
+    return chain
+
+
+def _compile_fallback_templates(
+    data: dict,
+) -> dict[str, tuple[tuple[str, ...], ...]]:
+    compiled = {}
+    for prompt_name, entry in data.items():
+        if not isinstance(entry, dict):
+            continue
+        messages = entry.get("messages") or []
+        compiled[prompt_name] = tuple(
+            compile_template(str(message.get("template") or ""))
+            for message in messages[:2]
+        )
+    return compiled
+
+
+def _load_fallback_cache() -> tuple[float, dict, dict]:
+    """Return the cached fallback entry, re-reading it only if its mtime changed."""
+    global _fallback_cache
+    mtime = os.stat(FALLBACK_FILE).st_mtime
+    cached = _fallback_cache
+    if cached is not None and cached[0] == mtime:
+        return cached
+
+    with open(FALLBACK_FILE, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    _fallback_cache = (mtime, data, _compile_fallback_templates(data))
+    return _fallback_cache
+
+
 def execute_with_fallback(
     prompt_name: str,
     format_vars: dict,
@@ -58,9 +147,7 @@ def execute_with_fallback(
     # ─── PRIMARY: LangSmith Hub ────────────────────────────────────────────────
     _hub_err_msg: str | None = None  # persists hub error across except scope
     try:
-        chain = _get_ls_client().pull_prompt(
-            prompt_name, include_model=True, secrets_from_env=True
-        )
+        chain = _cached_pull(prompt_name)
         prompt_template = getattr(chain, "first", None)
         prompt_metadata = (
             getattr(prompt_template, "metadata", {}) if prompt_template else {}
@@ -110,15 +197,17 @@ def execute_with_fallback(
 
     # ─── FALLBACK: Local JSON ─────────────────────────────────────────────────
     try:
-        with open(FALLBACK_FILE, "r", encoding="utf-8") as f:
-            fallback_data = json.load(f).get(prompt_name)
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        _, fallback_json, compiled_templates = _load_fallback_cache()
+        fallback_data = fallback_json.get(prompt_name)
 
         if not fallback_data:
             raise ValueError(f"'{prompt_name}' not found in fallback JSON.")
 
-        raw_messages = fallback_data.get("messages", [])
-        sys_template = raw_messages[0]["template"] if len(raw_messages) > 0 else ""
-        hum_template = raw_messages[1]["template"] if len(raw_messages) > 1 else ""
+        segments = compiled_templates.get(prompt_name, ())
+        sys_segments = segments[0] if len(segments) > 0 else ()
+        hum_segments = segments[1] if len(segments) > 1 else ()
 
         # Model config from the JSON (saved from last successful Hub sync)
         model_cfg = fallback_data.get("model_config", {})
@@ -137,12 +226,8 @@ def execute_with_fallback(
         # We cannot use ChatPromptTemplate.from_messages() + .invoke(format_vars) here
         # because LangChain calls Python's .format(), which fails when VALUES (e.g.
         # panorama_content) themselves contain curly braces from markdown content.
-        sys_content = sys_template
-        hum_content = hum_template
-        for key, value in format_vars.items():
-            placeholder = "{" + key + "}"
-            sys_content = sys_content.replace(placeholder, str(value or ""))
-            hum_content = hum_content.replace(placeholder, str(value or ""))
+        sys_content = render_segments(sys_segments, format_vars)
+        hum_content = render_segments(hum_segments, format_vars)
 
         msgs = [SystemMessage(content=sys_content), HumanMessage(content=hum_content)]
 
@@ -10,39 +10,57 @@ import json
 import sys
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured, machine-parseable output."""
 
+    # Extra fields attached when present (run_id, node, tokens, etc.)
+    _EXTRA_KEYS = (
+        "run_id",
+        "node",
+        "model",
+        "prompt_commit_hash",
+        "tokens",
+        "duration_ms",
+        "risk_level",
+        "alerts",
+        "cache_key",
+        "event",
+    )
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # record.created is the emit time already captured by logging
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Attach extra fields (run_id, node, tokens, etc.)
-        for key in (
-            "run_id",
-            "node",
-            "model",
-            "prompt_commit_hash",
-            "tokens",
-            "duration_ms",
-            "risk_level",
-            "alerts",
-            "cache_key",
-            "event",
-        ):
-            value = getattr(record, key, None)
+        # Extras live in the record's __dict__; dict.get skips getattr's
+        # descriptor lookup for the (usual) missing keys
+        record_dict = record.__dict__
+        for key in self._EXTRA_KEYS:
+            value = record_dict.get(key)
             if value is not None:
                 log_data[key] = value
 
         if record.exc_info and record.exc_info[0] is not None:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_data, default=str).decode("utf-8")
+            except TypeError:
+                pass
+        return json.dumps(log_data, ensure_ascii=False, default=str)
 
 
 def setup_logging(level: int = logging.INFO) -> None:
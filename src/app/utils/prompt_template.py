@@ -0,0 +1,37 @@
+"""
+Prompt Template Rendering
+
+Shared `{name}` substitution for prompt templates rendered outside LangChain
+(Hub fallback JSON, ADK lexical grounding). Python's str.format() is avoided
+because substituted values (e.g. markdown) may themselves contain braces.
+"""
+
+import re
+from typing import Any
+
+_PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def compile_template(template: str) -> tuple[str, ...]:
+    """Split a template once into literals (even indices) and names (odd)."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def render_segments(segments: tuple[str, ...], variables: dict[str, Any]) -> str:
+    """
+    Fill pre-split `{name}` placeholders with a single join. Unknown names are
+    left as-is, None renders as an empty string, and substituted values are
+    never re-scanned for placeholders.
+    """
+    return "".join(
+        (
+            segment
+            if index % 2 == 0
+            else (
+                ("" if variables[segment] is None else str(variables[segment]))
+                if segment in variables
+                else "{" + segment + "}"
+            )
+        )
+        for index, segment in enumerate(segments)
+    )
@@ -4,11 +4,16 @@ Theological Agent API
 FastAPI backend for the multi-agent theological analysis system.
 """
 
+import asyncio
+import os
 import time
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 
 # Load environment variables for LangSmith and API Keys
@@ -24,19 +29,45 @@ from app.controller.hitl_controller import router as hitl_router
 setup_logging()
 logger = get_logger(__name__)
 
-# Track startup time for uptime calculation
-_startup_time = time.time()
 _app_version = "1.1.0"
 
+# Cache the DB health probe so frequent monitors don't hit the pool every poll
+_HEALTH_TTL = 5.0
+_last_health: tuple[float, bool] | None = None
+_health_lock = asyncio.Lock()
+
+
+async def _cached_db_health() -> bool:
+    """check_db_health() result, refreshed at most once per _HEALTH_TTL."""
+    global _last_health
+    if _last_health and time.monotonic() - _last_health[0] < _HEALTH_TTL:
+        return _last_health[1]
+    async with _health_lock:
+        # Another request may have refreshed it while we waited for the lock
+        if _last_health and time.monotonic() - _last_health[0] < _HEALTH_TTL:
+            return _last_health[1]
+        db_healthy = await asyncio.to_thread(check_db_health)
+        _last_health = (time.monotonic(), db_healthy)
+        return db_healthy
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown events."""
     # --- Startup ---
+    # Per-process startup time for uptime (each uvicorn worker has its own);
+    # monotonic so wall-clock adjustments don't skew it
+    app.state.startup_monotonic = time.monotonic()
+    app.state.version = _app_version
     logger.info(
         f"Starting Theological Agent API v{_app_version}",
         extra={"event": "startup"},
     )
+    # Surface a misconfigured app (e.g. a missing router) right at startup
+    logger.info(
+        f"Registered routes: {[route.path for route in app.routes]}",
+        extra={"event": "startup"},
+    )
 
     yield
 
@@ -50,17 +81,27 @@ app = FastAPI(
     description="API backend for the multi-agent theological analysis system.",
     version=_app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# CORS Middleware (allow Streamlit frontend)
+# CORS Middleware (allow Streamlit frontend). FRONTEND_ORIGIN accepts a
+# comma-separated list; max_age lets browsers cache the preflight for a day.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, restrict to your frontend URL
+    allow_origins=[
+        origin.strip()
+        for origin in os.getenv("FRONTEND_ORIGIN", "http://localhost:8501").split(",")
+        if origin.strip()
+    ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,
 )
 
+# Compress larger JSON bodies (e.g. /analyze markdown); small ones aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Include routers
 app.include_router(bible_router)
 app.include_router(analyze_router)
@@ -74,19 +115,17 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Enhanced health check with DB connectivity, uptime, and version.
     Designed for external monitoring (e.g., Render, UptimeRobot).
     """
-    from datetime import datetime, timezone
-
-    uptime_seconds = int(time.time() - _startup_time)
-    db_healthy = check_db_health()
+    uptime_seconds = int(time.monotonic() - request.app.state.startup_monotonic)
+    db_healthy = await _cached_db_health()
 
     return {
         "status": "healthy" if db_healthy else "degraded",
-        "version": _app_version,
+        "version": request.app.state.version,
         "uptime_seconds": uptime_seconds,
         "database": "connected" if db_healthy else "disconnected",
         "timestamp": datetime.now(timezone.utc).isoformat(),
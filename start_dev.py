@@ -3,6 +3,83 @@ import sys
 import time
 import os
 import signal
+import socket
+
+
+def wait_port(host, port, timeout=30):
+    """Espera até que host:port aceite conexões TCP (ou até o timeout)."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+# Cada filho roda no próprio grupo de processos, para que o reloader do uvicorn
+# e os subprocessos do Streamlit sejam encerrados junto com ele
+if sys.platform == "win32":
+    POPEN_GROUP_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    POPEN_GROUP_KWARGS = {"start_new_session": True}
+
+
+def _signal_group(p, force=False):
+    """Envia SIGTERM (ou SIGKILL se force) para todo o grupo do processo."""
+    try:
+        if sys.platform == "win32":
+            if force:
+                # taskkill /T derruba a árvore inteira, não só o filho direto
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(p.pid)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            else:
+                p.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(
+                os.getpgid(p.pid), signal.SIGKILL if force else signal.SIGTERM
+            )
+    except (ProcessLookupError, OSError):
+        pass
+
+
+def stop_processes(processes, grace=2):
+    """Encerra os grupos com SIGTERM e força SIGKILL após o período de graça."""
+    for p in processes:
+        if p.poll() is None:
+            _signal_group(p)
+    deadline = time.monotonic() + grace
+    for p in processes:
+        try:
+            p.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _signal_group(p, force=True)
+            p.wait()
+
+
+def wait_any(processes):
+    """Bloqueia até que qualquer um dos processos termine."""
+    if sys.platform == "win32":
+        import _winapi
+
+        handles = [p._handle for p in processes]
+        # Timeout de 1s apenas para o Ctrl+C continuar funcionando no Windows;
+        # a saída de um filho acorda a espera imediatamente
+        while (
+            _winapi.WaitForMultipleObjects(handles, False, 1000)
+            == _winapi.WAIT_TIMEOUT
+        ):
+            pass
+    elif hasattr(os, "waitid"):
+        # WNOWAIT não colhe o filho, então Popen.poll/wait continuam funcionando
+        os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOWAIT)
+    else:
+        while all(p.poll() is None for p in processes):
+            time.sleep(1)
 
 
 def start_services():
@@ -29,8 +106,17 @@ def start_services():
         "0.0.0.0",
         "--port",
         "8000",
-        "--reload",
+        "--loop",
+        "auto",
+        "--http",
+        "httptools",
     ]
+    # --reload só funciona com um único worker; UVICORN_WORKERS>1 desliga o reload
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    if workers > 1:
+        backend_cmd += ["--workers", str(workers)]
+    else:
+        backend_cmd.append("--reload")
 
     # Comando para o Frontend
     frontend_cmd = [
@@ -49,38 +135,31 @@ def start_services():
         # Abre o Backend
         print("📡 Iniciando Backend na porta 8000...")
         p_backend = subprocess.Popen(
-            backend_cmd, cwd=os.path.join(os.getcwd(), "src"), env=backend_env
+            backend_cmd,
+            cwd=os.path.join(os.getcwd(), "src"),
+            env=backend_env,
+            **POPEN_GROUP_KWARGS,
         )
         processes.append(p_backend)
 
-        # Espera um pouco para o backend subir e processar o JSON se necessário
-        time.sleep(5)
+        # Espera o backend aceitar conexões em vez de um sleep fixo
+        if not wait_port("127.0.0.1", 8000):
+            print("⚠️ Backend não respondeu na porta 8000; iniciando Streamlit mesmo assim.")
 
         # Abre o Frontend
         print("💻 Iniciando Streamlit na porta 8501...")
-        p_frontend = subprocess.Popen(frontend_cmd)
+        p_frontend = subprocess.Popen(frontend_cmd, **POPEN_GROUP_KWARGS)
         processes.append(p_frontend)
 
         print("\n✅ Sistema pronto! Pressione Ctrl+C para encerrar tudo.\n")
 
         # Mantém o script rodando enquanto os processos estiverem vivos
-        while True:
-            time.sleep(1)
-            if p_backend.poll() is not None or p_frontend.poll() is not None:
-                break
+        wait_any(processes)
 
     except KeyboardInterrupt:
         print("\nBye! Encerrando processos...")
     finally:
-        for p in processes:
-            try:
-                p.terminate()
-                p.wait(timeout=2)
-            except:
-                try:
-                    p.kill()
-                except:
-                    pass
+        stop_processes(processes)
         print("✨ Tudo limpo.")
 
 
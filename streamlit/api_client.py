@@ -2,6 +2,12 @@ import json
 import requests
 import os
 import sys
+import threading
+import time
+import traceback
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Garante que a pasta 'src' está no PATH para o Direct-Call (Modo Cloud)
 try:
@@ -11,28 +17,106 @@ try:
 except Exception:
     pass
 
+try:
+    from app.service.bible_service import get_verses as _direct_get_verses
+except ImportError:  # pragma: no cover - src/ not on the path
+    _direct_get_verses = None
+
+# Se não há servidor de API (Streamlit Cloud), não tentar HTTP a cada chamada;
+# reconsulta o backend só depois deste intervalo. O timeout de leitura é folgado
+# porque uma instância do Render "dormindo" demora a responder o primeiro GET
+BACKEND_PROBE_TIMEOUT = (3, 10)
+BACKEND_REPROBE_SECONDS = 60
+
+
+def _is_unreachable(exc: Exception) -> bool:
+    """Connection refused / DNS failure; a timeout means the backend is just slow."""
+    return isinstance(exc, requests.exceptions.ConnectionError) and not isinstance(
+        exc, requests.exceptions.Timeout
+    )
+
 
 class APIClient:
     def __init__(self):
         self.base_url = os.getenv("API_BASE_URL", "http://localhost:8000")
         self.timeout = 600  # Increased to 10 minutes for deep analysis chains
+        # Sessão única: reaproveita conexões keep-alive com o backend
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "theo-agent-streamlit"})
+        # Retry só em GET (idempotente); connect=0 para o fallback Direct-Call
+        # não esperar backoff quando não há servidor de API
+        retry = Retry(
+            total=2,
+            connect=0,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._has_backend = None
+        self._probed_at = 0.0
+        self._probe_lock = threading.Lock()
+        self._hitl_etag = None
+        self._hitl_pending = []
+        # Probe (and open the keep-alive connection) while the page is loading,
+        # so the first verse fetch doesn't pay the TCP/TLS handshake
+        threading.Thread(target=self._warm, daemon=True).start()
 
-    def get_verses(self, abbrev: str, chapter: int):
+    def close(self):
+        self.session.close()
+
+    def _backend_available(self) -> bool:
+        """Whether the API server is reachable; probed lazily and cached."""
+        if self._has_backend:
+            return True
+        # Serialized so a caller arriving during the warm-up probe waits for
+        # its result instead of probing a second time
+        with self._probe_lock:
+            now = time.monotonic()
+            stale = now - self._probed_at >= BACKEND_REPROBE_SECONDS
+            if self._has_backend is None or stale:
+                try:
+                    self.session.get(
+                        f"{self.base_url}/", timeout=BACKEND_PROBE_TIMEOUT
+                    )
+                    self._has_backend = True
+                except requests.exceptions.RequestException as e:
+                    # Só desiste do backend se ele não existe; lento != ausente
+                    self._has_backend = not _is_unreachable(e)
+                self._probed_at = now
+            return self._has_backend
+
+    def _warm(self):
         try:
-            response = requests.get(
-                f"{self.base_url}/bible/{abbrev}/{chapter}/verses", timeout=5
-            )
-            if response.status_code == 200:
-                return response.json()
+            self._backend_available()
         except Exception:
-            # Fallback para execução direta (Streamlit Cloud)
+            pass
+
+    def _mark_backend_down(self):
+        self._has_backend = False
+        self._probed_at = time.monotonic()
+
+    def get_verses(self, abbrev: str, chapter: int):
+        if self._backend_available():
             try:
-                from app.service.bible_service import get_verses
+                response = self.session.get(
+                    f"{self.base_url}/bible/{abbrev}/{chapter}/verses", timeout=5
+                )
+                return response.json() if response.status_code == 200 else None
+            except requests.exceptions.ConnectionError as e:
+                if _is_unreachable(e):
+                    self._mark_backend_down()
+            except Exception:
+                pass
 
-                return get_verses(abbrev, chapter)
-            except Exception as e:
-                print(f"Erro no modo Direct-Call (get_verses): {e}")
-                return []
+        # Fallback para execução direta (Streamlit Cloud)
+        try:
+            return _direct_get_verses(abbrev, chapter)
+        except Exception as e:
+            print(f"Erro no modo Direct-Call (get_verses): {e}")
+            return []
 
 
     def stream_analyze(self, payload: dict):
@@ -50,22 +134,30 @@ class APIClient:
           "complete"     – graph done; includes final result fields
           "error"        – unrecoverable failure
         """
+        if not self._backend_available():
+            yield from self._stream_direct(payload)
+            return
+
         try:
-            response = requests.post(
+            # Short connect timeout; the read timeout stays long because the
+            # server keeps sending NDJSON events while the graph runs
+            with self.session.post(
                 f"{self.base_url}/analyze/stream",
                 json=payload,
                 stream=True,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-            for raw_line in response.iter_lines():
-                if raw_line:
-                    try:
-                        yield json.loads(raw_line)
-                    except json.JSONDecodeError:
-                        pass  # skip malformed lines
-        except requests.exceptions.ConnectionError:
+                timeout=(5, self.timeout),
+            ) as response:
+                response.raise_for_status()
+                for raw_line in response.iter_lines():
+                    if raw_line:
+                        try:
+                            yield json.loads(raw_line)
+                        except json.JSONDecodeError:
+                            pass  # skip malformed lines
+        except requests.exceptions.ConnectionError as e:
             # No API server — run directly (Streamlit Cloud)
+            if _is_unreachable(e):
+                self._mark_backend_down()
             yield from self._stream_direct(payload)
         except Exception as e:
             yield {"event": "error", "error": str(e)}
@@ -83,16 +175,24 @@ class APIClient:
             )
             yield from stream_analysis(input_data)
         except Exception as e:
-            import traceback
             print(traceback.format_exc())
             yield {"event": "error", "error": str(e)}
 
     def get_hitl_pending(self) -> list:
         """Get pending HITL reviews."""
+        if not self._backend_available():
+            return []
         try:
-            response = requests.get(f"{self.base_url}/hitl/pending", timeout=5)
+            headers = {"If-None-Match": self._hitl_etag} if self._hitl_etag else {}
+            response = self.session.get(
+                f"{self.base_url}/hitl/pending", headers=headers, timeout=5
+            )
+            if response.status_code == 304:
+                return self._hitl_pending
             if response.status_code == 200:
-                return response.json().get("pending", [])
+                self._hitl_pending = response.json().get("pending", [])
+                self._hitl_etag = response.headers.get("ETag")
+                return self._hitl_pending
         except Exception:
             pass
         return []
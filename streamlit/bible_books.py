@@ -65,4 +65,11 @@ BOOKS = {
     "3Jo": {"name": "3 João", "chapters": 1},
     "Jd": {"name": "Judas", "chapters": 1},
     "Ap": {"name": "Apocalipse", "chapters": 22},
-}
\ No newline at end of file
+}
+
+# Computed once at import; the Streamlit script itself re-executes on every rerun
+BOOK_OPTIONS = tuple(BOOKS.keys())
+
+
+def format_book(abbrev: str) -> str:
+    return BOOKS[abbrev]["name"]
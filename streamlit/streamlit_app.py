@@ -1,24 +1,33 @@
 import streamlit as st
+import hashlib
+import json
 import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
 from dotenv import load_dotenv
-from bible_books import BOOKS
-from api_client import api_client
+from bible_books import BOOKS, BOOK_OPTIONS, format_book
 import time
 
 # --- Environment & Tracing Setup ---
-load_dotenv()
-
-try:
-    if "LANGCHAIN_TRACING_V2" in st.secrets:
-        for key, value in st.secrets.items():
-            if (
-                key.startswith("LANGCHAIN_")
-                or key == "GOOGLE_API_KEY"
-                or key == "LANGSMITH_API_KEY"
-            ):
-                os.environ[key] = str(value)
-except Exception:
-    pass  # No secrets.toml — running locally with .env
+@st.cache_resource
+def _init_env():
+    """Load .env and propagate tracing secrets to os.environ once per process."""
+    load_dotenv()
+    try:
+        if "LANGCHAIN_TRACING_V2" in st.secrets:
+            for key, value in st.secrets.items():
+                if key.startswith("LANGCHAIN_") or key in (
+                    "GOOGLE_API_KEY",
+                    "LANGSMITH_API_KEY",
+                ):
+                    os.environ[key] = str(value)
+    except Exception:
+        pass  # No secrets.toml — running locally with .env
+
+
+_init_env()
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -29,31 +38,69 @@ st.set_page_config(
 )
 
 # --- CSS Injection ---
-with open("streamlit/style.css") as f:
-    st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+@st.cache_resource
+def _load_css(path="streamlit/style.css"):
+    with open(path) as f:
+        return f.read()
+
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # --- State Initialization ---
-if "chapter_data" not in st.session_state:
-    st.session_state.chapter_data = []
-if "analysis_result" not in st.session_state:
-    st.session_state.analysis_result = None
-if "is_analyzing" not in st.session_state:
-    st.session_state.is_analyzing = False
-if "selected_verses_ids" not in st.session_state:
-    st.session_state.selected_verses_ids = []
-if "do_analysis" not in st.session_state:
-    st.session_state.do_analysis = False
+st.session_state.setdefault("chapter_data", [])
+st.session_state.setdefault("analysis_result", None)
+st.session_state.setdefault("is_analyzing", False)
+st.session_state.setdefault("do_analysis", False)
 
 
 # --- Helper Functions ---
+@st.cache_resource
+def _get_api_client():
+    """Shared API client (HTTP session + connection pool), built on first use."""
+    from api_client import api_client
+
+    return api_client
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_get_verses(abbrev: str, chapter: int):
+    """Chapter text is immutable; cache it across reruns and sessions."""
+    verses = _get_api_client().get_verses(abbrev, chapter)
+    if not verses:
+        # Exceptions are not cached, so a failed fetch is retried next time
+        raise LookupError(f"No verses for {abbrev} {chapter}")
+    return verses
+
+
 def fetch_chapter_data():
     """Fetches verses when book or chapter changes."""
     book = st.session_state.get("selected_book_abbrev")
     chapter = st.session_state.get("selected_chapter")
     if book and chapter:
-        verses = api_client.get_verses(book, chapter)
+        try:
+            verses = _cached_get_verses(book, chapter)
+        except LookupError:
+            verses = []
         st.session_state.chapter_data = verses
-        st.session_state.selected_verses_ids = []
+        # Edits are row-positional, so they must not carry over to a new chapter
+        st.session_state.pop("verse_editor", None)
+
+
+def _selected_verse_numbers():
+    """Verse numbers currently ticked in the verse editor (or all, if select-all)."""
+    chapter_data = st.session_state.get("chapter_data", [])
+    if st.session_state.get("select_all_verses"):
+        return [v["number"] for v in chapter_data]
+    editor_state = st.session_state.get("verse_editor") or {}
+    edited_rows = {
+        int(row): changes
+        for row, changes in editor_state.get("edited_rows", {}).items()
+    }
+    return [
+        chapter_data[row]["number"]
+        for row in sorted(edited_rows)
+        if row < len(chapter_data) and edited_rows[row].get("select")
+    ]
 
 
 def _build_payload():
@@ -61,13 +108,7 @@ def _build_payload():
     book = st.session_state.selected_book_abbrev
     chapter = st.session_state.selected_chapter
 
-    verses = []
-    if st.session_state.get("select_all_verses"):
-        verses = [v["number"] for v in st.session_state.get("chapter_data", [])]
-    else:
-        for v in st.session_state.get("chapter_data", []):
-            if st.session_state.get(f"v_{v['number']}"):
-                verses.append(v["number"])
+    verses = _selected_verse_numbers()
 
     mode = st.session_state.mode
     modules = []
@@ -89,6 +130,145 @@ def _build_payload():
     }
 
 
+# Process-wide cache of finished analyses, so re-running an identical request
+# doesn't even need a round trip to the API. Backed by a small SQLite file so
+# results survive Streamlit restarts.
+ANALYSIS_CACHE_TTL = 60 * 60
+ANALYSIS_CACHE_MAX = 256
+ANALYSIS_DISK_TTL = 7 * 24 * 60 * 60
+ANALYSIS_CACHE_DB = os.getenv(
+    "ANALYSIS_CACHE_DB",
+    os.path.join(tempfile.gettempdir(), "theo_analysis_cache.sqlite3"),
+)
+
+
+@st.cache_resource
+def _analysis_cache():
+    try:
+        db = sqlite3.connect(ANALYSIS_CACHE_DB, check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS analyses "
+            "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, result TEXT NOT NULL)"
+        )
+    except sqlite3.Error as e:
+        print(f"Cache de análises em disco indisponível: {e}")
+        db = None
+    return OrderedDict(), threading.Lock(), db
+
+
+def _disk_key(key):
+    return hashlib.blake2b(
+        json.dumps(key).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _analysis_key(payload):
+    return (
+        payload["book"],
+        payload["chapter"],
+        tuple(sorted(payload["verses"])),
+        tuple(sorted(payload["selected_modules"])),
+    )
+
+
+def _is_cacheable(result):
+    """Same rule as the backend cache: a non-empty analysis with no HITL status."""
+    return bool(result.get("final_analysis")) and not result.get("hitl_status")
+
+
+def _cached_result(key):
+    cache, lock, db = _analysis_cache()
+    with lock:
+        entry = cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] <= ANALYSIS_CACHE_TTL:
+                cache.move_to_end(key)
+                return entry[1]
+            del cache[key]
+
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT stored_at, result FROM analyses WHERE key = ?",
+                (_disk_key(key),),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[0] > ANALYSIS_DISK_TTL:
+            return None
+
+        result = json.loads(row[1])
+        cache[key] = (time.monotonic(), result)
+        while len(cache) > ANALYSIS_CACHE_MAX:
+            cache.popitem(last=False)
+        return result
+
+
+def _store_result(key, result):
+    cache, lock, db = _analysis_cache()
+    with lock:
+        cache[key] = (time.monotonic(), result)
+        cache.move_to_end(key)
+        while len(cache) > ANALYSIS_CACHE_MAX:
+            cache.popitem(last=False)
+
+        # Only results the backend itself would cache may outlive the process
+        if db is None or not _is_cacheable(result):
+            return
+        now = time.time()
+        try:
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO analyses (key, stored_at, result) "
+                    "VALUES (?, ?, ?)",
+                    (_disk_key(key), now, json.dumps(result, default=str)),
+                )
+                db.execute(
+                    "DELETE FROM analyses WHERE stored_at < ?",
+                    (now - ANALYSIS_DISK_TTL,),
+                )
+        except sqlite3.Error as e:
+            print(f"Falha ao gravar cache de análises: {e}")
+
+
+@st.fragment
+def _verse_selector():
+    """Verse selection panel; ticking verses reruns only this fragment."""
+    st.write("Selecione os versículos:")
+
+    if not st.session_state.chapter_data:
+        st.spinner("Carregando versículos...")
+        return
+
+    select_all = st.checkbox("Selecionar Todos", key="select_all_verses")
+
+    # A single data_editor instead of one checkbox + caption per verse keeps
+    # the widget tree O(1) regardless of chapter length
+    rows = [
+        {"select": select_all, "number": v["number"], "text": v["text"]}
+        for v in st.session_state.chapter_data
+    ]
+    st.data_editor(
+        rows,
+        column_config={
+            "select": st.column_config.CheckboxColumn("✓", default=False),
+            "number": st.column_config.NumberColumn("v"),
+            "text": st.column_config.TextColumn("Texto"),
+        },
+        disabled=["number", "text"] + (["select"] if select_all else []),
+        hide_index=True,
+        height=500,
+        width="stretch",
+        key="verse_editor",
+    )
+
+    # The Analyze button lives outside this fragment: rerun the whole app only
+    # when its enabled state has to flip
+    if bool(_selected_verse_numbers()) != st.session_state.get("has_selection"):
+        st.rerun()
+
+
 # ─── Labels for the streaming progress display ───────────────────────────────
 _STAGE_HEADINGS = {
     1: "🔍 Estágio 1 — Análise Multi-Agente",
@@ -106,19 +286,32 @@ _NODE_LABELS = {
 }
 
 
+# ─── Static HTML ─────────────────────────────────────────────────────────────
+_RESULT_HTML = '<div class="agent-result-container">\n\n{}\n\n</div>'
+_EMPTY_STATE_HTML = """
+<div style="
+    border: 2px dashed #31333F;
+    border-radius: 10px;
+    height: 500px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    color: #888;">
+    <h3>Aguardando Análise</h3>
+    <p>Selecione um texto e clique em "Analyze" para começar.</p>
+</div>
+"""
+
+
 # --- TOP CONTROL BAR ---
 with st.container():
     col1, col2, col3, col4 = st.columns([2, 2, 2, 1.5])
 
-    book_options = list(BOOKS.keys())
-
-    def format_book_func(abbrev):
-        return BOOKS[abbrev]["name"]
-
     selected_book_abbrev = col1.selectbox(
         "Livro",
-        options=book_options,
-        format_func=format_book_func,
+        options=BOOK_OPTIONS,
+        format_func=format_book,
         key="selected_book_abbrev",
         on_change=fetch_chapter_data,
     )
@@ -136,14 +329,8 @@ with st.container():
         col3.info("Todos os módulos serão executados.")
 
     # Determine if any verses are currently selected based on widget states
-    has_selection = False
-    if st.session_state.get("select_all_verses"):
-        has_selection = True
-    elif st.session_state.get("chapter_data"):
-        has_selection = any(
-            st.session_state.get(f"v_{v['number']}")
-            for v in st.session_state.chapter_data
-        )
+    has_selection = bool(_selected_verse_numbers())
+    st.session_state.has_selection = has_selection
 
     # Button sets a flag; analysis runs in the main render path below so that
     # st.status() can update live (on_click callbacks buffer all UI writes and
@@ -163,7 +350,8 @@ left_panel, right_panel = st.columns([1, 2])
 
 # --- LEFT PANEL: Context & Verses ---
 with left_panel:
-    max_chapters = BOOKS[selected_book_abbrev]["chapters"]
+    selected_book = BOOKS[selected_book_abbrev]
+    max_chapters = selected_book["chapters"]
 
     selected_chapter = st.number_input(
         f"Capítulo (1-{max_chapters})",
@@ -174,38 +362,12 @@ with left_panel:
         on_change=fetch_chapter_data,
     )
 
-    st.markdown(f"### {BOOKS[selected_book_abbrev]['name']} {selected_chapter}")
+    st.markdown(f"### {selected_book['name']} {selected_chapter}")
 
     if not st.session_state.chapter_data:
         fetch_chapter_data()
 
-    st.write("Selecione os versículos:")
-
-    if st.session_state.chapter_data:
-        select_all = st.checkbox("Selecionar Todos", key="select_all_verses")
-        if select_all:
-            st.session_state.selected_verses_ids = [
-                v["number"] for v in st.session_state.chapter_data
-            ]
-
-        current_selection = []
-        with st.container(height=500):
-            for verse in st.session_state.chapter_data:
-                v_num = verse["number"]
-                v_text = verse["text"]
-
-                is_checked = v_num in st.session_state.selected_verses_ids
-
-                v_col1, v_col2 = st.columns([0.15, 0.85])
-                if v_col1.checkbox(f"{v_num}", value=is_checked, key=f"v_{v_num}"):
-                    current_selection.append(v_num)
-
-                v_col2.caption(f"**{v_num}** {v_text}")
-
-        st.session_state.selected_verses_ids = current_selection
-
-    else:
-        st.spinner("Carregando versículos...")
+    _verse_selector()
 
 # --- RIGHT PANEL: Analysis / Streaming Progress / Results ---
 with right_panel:
@@ -216,13 +378,22 @@ with right_panel:
         st.session_state.is_analyzing = True
 
         payload = _build_payload()
+        cache_key = _analysis_key(payload)
+        cached = _cached_result(cache_key)
         result = None
         seen_stages: set = set()
 
+        # A local hit is replayed as a cache_hit event through the same loop
+        events = (
+            [{**cached, "event": "cache_hit", "from_cache": True}]
+            if cached
+            else _get_api_client().stream_analyze(payload)
+        )
+
         with st.status("📖 Analisando Escrituras...", expanded=True) as status:
             start_ts = time.time()
 
-            for event in api_client.stream_analyze(payload):
+            for event in events:
                 etype = event.get("event")
 
                 if etype == "cache_hit":
@@ -267,6 +438,16 @@ with right_panel:
                         "from_cache": False,
                     }
 
+        # Empty/failed runs and runs routed through HITL review are not cached,
+        # matching the backend's cache write in analysis_service
+        if (
+            cached is None
+            and result
+            and result.get("event") in ("complete", "cache_hit")
+            and _is_cacheable(result)
+        ):
+            _store_result(cache_key, result)
+
         st.session_state.analysis_result = result
         st.session_state.is_analyzing = False
         st.rerun()  # Re-render to display the result in the results panel below
@@ -313,8 +494,7 @@ with right_panel:
 
         # --- Main Content ---
         if final_text:
-            combined_html = f'<div class="agent-result-container">\n\n{final_text}\n\n</div>'
-            st.markdown(combined_html, unsafe_allow_html=True)
+            st.markdown(_RESULT_HTML.format(final_text), unsafe_allow_html=True)
 
             with st.expander("📋 Copiar Texto (Formato Markdown)"):
                 st.code(final_text, language="markdown")
@@ -330,16 +510,19 @@ with right_panel:
                 if result.get("tokens_consumed"):
                     with meta_cols[0]:
                         st.markdown("**Tokens Consumidos:**")
-                        tokens = result["tokens_consumed"]
-                        total_in = 0
-                        total_out = 0
-                        for node_name, usage in tokens.items():
-                            if isinstance(usage, dict):
-                                inp = usage.get("input", 0)
-                                out = usage.get("output", 0)
-                                total_in += inp
-                                total_out += out
-                                st.caption(f"`{node_name}`: {inp} in / {out} out")
+                        token_rows = [
+                            {
+                                "node": node_name,
+                                "in": usage.get("input", 0),
+                                "out": usage.get("output", 0),
+                            }
+                            for node_name, usage in result["tokens_consumed"].items()
+                            if isinstance(usage, dict)
+                        ]
+                        # One table widget instead of a caption per node
+                        st.dataframe(token_rows, hide_index=True, width="stretch")
+                        total_in = sum(row["in"] for row in token_rows)
+                        total_out = sum(row["out"] for row in token_rows)
                         st.markdown(
                             f"**Total: {total_in} in / {total_out} out = {total_in + total_out}**"
                         )
@@ -348,26 +531,14 @@ with right_panel:
                 if result.get("model_versions"):
                     with meta_cols[1]:
                         st.markdown("**Modelos Utilizados:**")
-                        models = result["model_versions"]
-                        for node_name, model in models.items():
-                            st.caption(f"`{node_name}`: {model}")
+                        # One markdown block instead of a caption per node
+                        st.markdown(
+                            "\n".join(
+                                f"- `{node_name}`: {model}"
+                                for node_name, model in result["model_versions"].items()
+                            )
+                        )
 
     else:
         # Empty State
-        st.markdown(
-            """
-            <div style="
-                border: 2px dashed #31333F;
-                border-radius: 10px;
-                height: 500px;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                align-items: center;
-                color: #888;">
-                <h3>Aguardando Análise</h3>
-                <p>Selecione um texto e clique em "Analyze" para começar.</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_EMPTY_STATE_HTML, unsafe_allow_html=True)
@@ -1,7 +1,12 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from langsmith import Client
+from langchain_core.prompts.chat import (
+    HumanMessagePromptTemplate,
+    SystemMessagePromptTemplate,
+)
 
 # Load environment variables
 load_dotenv()
@@ -21,6 +26,104 @@ FALLBACK_FILE = os.path.join(
 )
 
 
+def _extract(prompt_name, chain):
+    """
+    Extracts the system/human text templates and the model configuration
+    from a pulled (Prompt | Model) chain into a fallback record.
+    """
+    prompt_commit_hash = None
+
+    # 1. Extract Messages from the first part of the chain (ChatPromptTemplate)
+    extracted_messages = []
+    prompt_template = getattr(chain, "first", chain)
+    prompt_metadata = getattr(prompt_template, "metadata", {}) or {}
+    if isinstance(prompt_metadata, dict):
+        prompt_commit_hash = prompt_metadata.get("lc_hub_commit_hash")
+
+    if hasattr(prompt_template, "messages"):
+        for msg in prompt_template.messages:
+            match msg:
+                case SystemMessagePromptTemplate(prompt=prompt):
+                    msg_type = "system"
+                    template_text = getattr(prompt, "template", str(prompt))
+                case HumanMessagePromptTemplate(prompt=prompt):
+                    msg_type = "human"
+                    template_text = getattr(prompt, "template", str(prompt))
+                case _:
+                    msg_type = "system" if "System" in type(msg).__name__ else "human"
+                    # Other message templates (e.g. AI) still carry .prompt.template
+                    template_text = getattr(
+                        getattr(msg, "prompt", None),
+                        "template",
+                        getattr(msg, "content", str(msg)),
+                    )
+
+            extracted_messages.append({"type": msg_type, "template": template_text})
+    else:
+        extracted_messages.append(
+            {
+                "type": "system",
+                "template": getattr(
+                    prompt_template, "template", str(prompt_template)
+                ),
+            }
+        )
+
+    # 2. Extract Model Info from the last part of the chain (RunnableBinding -> ChatModel)
+    model_info = {}
+    model_node = getattr(chain, "last", None)
+
+    if model_node and hasattr(model_node, "bound"):
+        bound_model = model_node.bound
+
+        # Extract parameters correctly
+        model_name = getattr(
+            bound_model,
+            "model",
+            getattr(bound_model, "model_name", "gemini-2.5-flash"),
+        )
+        temperature = getattr(bound_model, "temperature", 0.0)
+
+        model_info = {"model_name": model_name, "temperature": temperature}
+
+    return {
+        "name": prompt_name,
+        "messages": extracted_messages,
+        "model_config": model_info,
+        "prompt_commit_hash": prompt_commit_hash,
+    }
+
+
+def _load_previous():
+    """Returns the current fallback file contents, or {} if missing/invalid."""
+    try:
+        with open(FALLBACK_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _pull(client, prompt_name, previous):
+    """
+    Returns (record, unchanged). When the prompt's latest commit on LangSmith
+    matches the hash already on disk, the previous record is reused and the
+    full chain pull/extraction is skipped.
+    """
+    cached = previous.get(prompt_name)
+    if cached and cached.get("prompt_commit_hash"):
+        try:
+            prompt = client.get_prompt(prompt_name)
+        except Exception:
+            prompt = None
+        latest_hash = getattr(prompt, "last_commit_hash", None)
+        if latest_hash and latest_hash == cached["prompt_commit_hash"]:
+            return cached, True
+
+    # Pull full chain (Prompt | Model) using secrets_from_env=True
+    chain = client.pull_prompt(prompt_name, include_model=True, secrets_from_env=True)
+    return _extract(prompt_name, chain), False
+
+
 def sync_prompts():
     """
     Fetches LangChain chains from LangSmith and extracts both the strict
@@ -30,82 +133,45 @@ def sync_prompts():
     os.makedirs(os.path.dirname(FALLBACK_FILE), exist_ok=True)
 
     client = Client()
+    previous = _load_previous()
     fallback_data = {}
     success_count = 0
 
-    for prompt_name in PROMPTS_TO_SYNC:
-        print(f"Pulling: {prompt_name}...")
-        try:
-            # Pull full chain (Prompt | Model) using secrets_from_env=True
-            chain = client.pull_prompt(
-                prompt_name, include_model=True, secrets_from_env=True
+    # Pulls are independent HTTPS round trips, so run them concurrently;
+    # results are collected in PROMPTS_TO_SYNC order to keep the JSON stable.
+    with ThreadPoolExecutor(max_workers=len(PROMPTS_TO_SYNC)) as executor:
+        futures = {}
+        for prompt_name in PROMPTS_TO_SYNC:
+            print(f"Pulling: {prompt_name}...")
+            futures[prompt_name] = executor.submit(
+                _pull, client, prompt_name, previous
             )
 
-            prompt_commit_hash = None
-
-            # 1. Extract Messages from the first part of the chain (ChatPromptTemplate)
-            extracted_messages = []
-            prompt_template = getattr(chain, "first", chain)
-            prompt_metadata = getattr(prompt_template, "metadata", {}) or {}
-            if isinstance(prompt_metadata, dict):
-                prompt_commit_hash = prompt_metadata.get("lc_hub_commit_hash")
-
-            if hasattr(prompt_template, "messages"):
-                for msg in prompt_template.messages:
-                    msg_type = "system" if "System" in type(msg).__name__ else "human"
-                    if hasattr(msg, "prompt") and hasattr(msg.prompt, "template"):
-                        template_text = msg.prompt.template
-                    elif hasattr(msg, "content"):
-                        template_text = msg.content
-                    else:
-                        template_text = str(msg)
-
-                    extracted_messages.append(
-                        {"type": msg_type, "template": template_text}
-                    )
-            else:
-                extracted_messages.append(
-                    {
-                        "type": "system",
-                        "template": getattr(
-                            prompt_template, "template", str(prompt_template)
-                        ),
-                    }
+        for prompt_name, future in futures.items():
+            try:
+                record, unchanged = future.result()
+            except Exception as e:
+                print(f"  -> Error processing {prompt_name}: {e}")
+                continue
+
+            fallback_data[prompt_name] = record
+            if unchanged:
+                print(
+                    f"  -> {prompt_name}: Unchanged (Commit: {record['prompt_commit_hash']})"
                 )
-
-            # 2. Extract Model Info from the last part of the chain (RunnableBinding -> ChatModel)
-            model_info = {}
-            model_node = getattr(chain, "last", None)
-
-            if model_node and hasattr(model_node, "bound"):
-                bound_model = model_node.bound
-
-                # Extract parameters correctly
-                model_name = getattr(
-                    bound_model,
-                    "model",
-                    getattr(bound_model, "model_name", "gemini-2.5-flash"),
-                )
-                temperature = getattr(bound_model, "temperature", 0.0)
-
-                model_info = {"model_name": model_name, "temperature": temperature}
-
-            fallback_data[prompt_name] = {
-                "name": prompt_name,
-                "messages": extracted_messages,
-                "model_config": model_info,
-                "prompt_commit_hash": prompt_commit_hash,
-            }
-
+                success_count += 1
+                continue
             print(
-                f"  -> Success ({len(extracted_messages)} msg, Model: {model_info.get('model_name')}, Commit: {prompt_commit_hash or 'unknown'})"
+                f"  -> {prompt_name}: Success ({len(record['messages'])} msg, Model: {record['model_config'].get('model_name')}, Commit: {record['prompt_commit_hash'] or 'unknown'})"
             )
             success_count += 1
 
-        except Exception as e:
-            print(f"  -> Error processing {prompt_name}: {e}")
+    if fallback_data == previous:
+        print(f"\nAll prompts up to date; {FALLBACK_FILE} left untouched.")
+        return
 
-    # Save to JSON elegantly
+    # Save to JSON elegantly; stdlib json keeps the tracked file's 4-space
+    # indent (orjson only offers 2), so syncs don't rewrite every line
     with open(FALLBACK_FILE, "w", encoding="utf-8") as f:
         json.dump(fallback_data, f, indent=4, ensure_ascii=False)
 